@@ -1,90 +1,118 @@
 #!/usr/bin/env python3
-import urllib.request
-import json
+from concurrent.futures import ThreadPoolExecutor
+import os
+import pickle
+import sys
+
+import requests
+from requests.adapters import HTTPAdapter
 
 # Fetch both sessions
 single_id = "23285355-4bcf-4c6d-b852-48b6716a57f3"
 batch_id = "2fdae302-76a1-43ec-8fef-38d270ee7e41"
 
-with urllib.request.urlopen(f"http://localhost:8000/api/sessions/{single_id}/") as resp:
-    single = json.loads(resp.read().decode())
-with urllib.request.urlopen(f"http://localhost:8000/api/sessions/{batch_id}/") as resp:
-    batch = json.loads(resp.read().decode())
-
-def analyze_session(name, data):
-    print(f"\n{'='*60}")
-    print(f"SESSION: {name}")
-    print(f"Name: {data['name']}")
-    print(f"Total evaluations: {len(data['evaluations'])}")
-    print('='*60)
+# Reuse one keep-alive connection to the local backend for every request
+s = requests.Session()
+s.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+CACHE_DIR = '.cache'
+
+
+def fetch(session_id):
+    # Per-provider min/max/avg are aggregated by the backend in a single GROUP BY query
+    url = f"http://localhost:8000/api/sessions/{session_id}/stats/"
+    path = os.path.join(CACHE_DIR, f"{session_id}.pkl")
     
-    # Group by provider
-    by_provider = {}
-    for e in data['evaluations']:
-        provider = e['provider_name']
-        if provider not in by_provider:
-            by_provider[provider] = []
-        by_provider[provider].append(e)
+    # Revalidate the cached copy by ETag; a 304 skips the body and the JSON parse
+    cached = None
+    try:
+        with open(path, 'rb') as f:
+            cached = pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError):
+        pass
     
-    for provider, evals in by_provider.items():
-        print(f"\n--- {provider} ({len(evals)} evaluations) ---")
-        
-        def calc_stats(field):
-            vals = [e[field] for e in evals if e[field] is not None]
-            if vals:
-                return {
-                    'min': min(vals),
-                    'max': max(vals),
-                    'avg': sum(vals)/len(vals)
-                }
-            return None
+    headers = {'If-None-Match': cached['etag']} if cached and cached.get('etag') else {}
+    r = s.get(url, headers=headers, timeout=10)
+    if r.status_code == 304 and cached:
+        return cached['data']
+    
+    data = r.json()
+    etag = r.headers.get('ETag')
+    if etag:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(path, 'wb') as f:
+            pickle.dump({'etag': etag, 'data': data}, f)
+    return data
+
+# The two sessions are independent, so fetch them concurrently
+with ThreadPoolExecutor(max_workers=2) as ex:
+    single, batch = ex.map(fetch, [single_id, batch_id])
+s.close()
+
+
+def analyze_session(name, data, out):
+    out.append("\n" + RULE)
+    out.append(f"SESSION: {name}\n")
+    out.append(f"Name: {data['name']}\n")
+    out.append(f"Total evaluations: {data['total_evaluations']}\n")
+    out.append(RULE)
+    
+    for p in data['providers']:
+        out.append(f"\n--- {p['provider_name']} ({p['evaluation_count']} evaluations) ---\n")
         
-        metrics = ['time_to_first_audio', 'total_synthesis_time', 'playback_jitter', 'audio_duration', 'realtime_factor']
-        for m in metrics:
-            s = calc_stats(m)
-            if s:
-                print(f"  {m:25s}: min={s['min']:8.2f}, max={s['max']:8.2f}, avg={s['avg']:8.2f}")
+        for m, stats in p['metrics'].items():
+            if stats['avg'] is not None:
+                out.append(f"  {m:25s}: min={stats['min']:8.2f}, max={stats['max']:8.2f}, avg={stats['avg']:8.2f}\n")
+
+# Report lines are collected here and written once at the end
+RULE = '='*60 + "\n"
+out = []
 
-print("="*60)
-print("METRICS COMPARISON: Single vs Batch Sessions")
-print("="*60)
+out.append(RULE)
+out.append("METRICS COMPARISON: Single vs Batch Sessions\n")
+out.append(RULE)
 
-analyze_session("SINGLE (Metric Calibration Test)", single)
-analyze_session("BATCH SESSION", batch)
+analyze_session("SINGLE (Metric Calibration Test)", single, out)
+analyze_session("BATCH SESSION", batch, out)
 
 # Direct comparison
-print("\n" + "="*60)
-print("DIRECT COMPARISON BY PROVIDER")
-print("="*60)
+out.append("\n" + RULE)
+out.append("DIRECT COMPARISON BY PROVIDER\n")
+out.append(RULE)
 
-single_evals = single['evaluations']
-batch_evals = batch['evaluations']
+single_providers = {p['provider_name']: p for p in single['providers']}
+batch_providers = {p['provider_name']: p for p in batch['providers']}
 
 for provider in ['ElevenLabs', 'Amazon Polly']:
-    s_evals = [e for e in single_evals if e['provider_name'] == provider]
-    b_evals = [e for e in batch_evals if e['provider_name'] == provider]
+    s_stats = single_providers.get(provider)
+    b_stats = batch_providers.get(provider)
     
-    print(f"\n{provider}:")
-    print(f"  Single session: {len(s_evals)} eval(s)")
-    print(f"  Batch session:  {len(b_evals)} eval(s)")
+    out.append(f"\n{provider}:\n")
+    out.append(f"  Single session: {s_stats['evaluation_count'] if s_stats else 0} eval(s)\n")
+    out.append(f"  Batch session:  {b_stats['evaluation_count'] if b_stats else 0} eval(s)\n")
     
-    if s_evals and b_evals:
-        s_ttfa = s_evals[0]['time_to_first_audio']
-        b_ttfa_avg = sum(e['time_to_first_audio'] for e in b_evals if e['time_to_first_audio']) / len(b_evals)
-        print(f"  TTFA - Single: {s_ttfa:.2f}ms, Batch avg: {b_ttfa_avg:.2f}ms, diff: {abs(s_ttfa-b_ttfa_avg):.2f}ms ({abs(s_ttfa-b_ttfa_avg)/s_ttfa*100:.1f}%)")
+    if s_stats and b_stats:
+        # Session averages are None when no evaluation recorded the metric (e.g. all failed)
+        s_ttfa = s_stats['metrics']['time_to_first_audio']['avg']
+        b_ttfa_avg = b_stats['metrics']['time_to_first_audio']['avg']
+        if s_ttfa is not None and b_ttfa_avg is not None:
+            pct = f" ({abs(s_ttfa-b_ttfa_avg)/s_ttfa*100:.1f}%)" if s_ttfa else ""
+            out.append(f"  TTFA - Single avg: {s_ttfa:.2f}ms, Batch avg: {b_ttfa_avg:.2f}ms, diff: {abs(s_ttfa-b_ttfa_avg):.2f}ms{pct}\n")
         
-        s_jitter = s_evals[0]['playback_jitter']
-        b_jitter_avg = sum(e['playback_jitter'] for e in b_evals if e['playback_jitter']) / len(b_evals)
-        print(f"  Jitter - Single: {s_jitter:.2f}ms, Batch avg: {b_jitter_avg:.2f}ms, diff: {abs(s_jitter-b_jitter_avg):.2f}ms")
+        s_jitter = s_stats['metrics']['playback_jitter']['avg']
+        b_jitter_avg = b_stats['metrics']['playback_jitter']['avg']
+        if s_jitter is not None and b_jitter_avg is not None:
+            out.append(f"  Jitter - Single avg: {s_jitter:.2f}ms, Batch avg: {b_jitter_avg:.2f}ms, diff: {abs(s_jitter-b_jitter_avg):.2f}ms\n")
         
-        s_rtf = s_evals[0]['realtime_factor']
-        b_rtf_avg = sum(e['realtime_factor'] for e in b_evals if e['realtime_factor']) / len(b_evals)
-        print(f"  RTF - Single: {s_rtf:.2f}x, Batch avg: {b_rtf_avg:.2f}x, diff: {abs(s_rtf-b_rtf_avg):.2f}x")
-
-print("\n" + "="*60)
-print("ANALYSIS CONCLUSIONS")
-print("="*60)
-print("""
+        s_rtf = s_stats['metrics']['realtime_factor']['avg']
+        b_rtf_avg = b_stats['metrics']['realtime_factor']['avg']
+        if s_rtf is not None and b_rtf_avg is not None:
+            out.append(f"  RTF - Single avg: {s_rtf:.2f}x, Batch avg: {b_rtf_avg:.2f}x, diff: {abs(s_rtf-b_rtf_avg):.2f}x\n")
+
+out.append("\n" + RULE)
+out.append("ANALYSIS CONCLUSIONS\n")
+out.append(RULE)
+out.append("""
 Key Observations:
 1. ElevenLabs shows HIGHER TTFA (~1300-1500ms) but VERY LOW jitter (~1ms)
    - This indicates TRUE STREAMING: chunks arrive consistently after initial delay
@@ -97,4 +125,8 @@ Key Observations:
    - Similar ranges for same provider across both session types
    
 4. The metric patterns are CORRECT and EXPECTED based on provider behavior.
+
 """)
+
+# Emit the whole report with one write instead of a print (and lock/flush) per line
+sys.stdout.write(''.join(out))
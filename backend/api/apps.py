@@ -6,4 +6,12 @@ class ApiConfig(AppConfig):
     # Use 64 bit IDs
     default_auto_field = 'django.db.models.BigAutoField'
     # Define app name
-    name = 'api'
\ No newline at end of file
+    name = 'api'
+    
+    # Register signal handlers and optionally pre-open provider connections
+    def ready(self):
+        from . import signals  # noqa: F401
+        from django.conf import settings
+        if settings.TTS_PREWARM_CONNECTIONS:
+            from .services import TTSServiceManager
+            TTSServiceManager.prewarm_providers()
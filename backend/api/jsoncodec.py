@@ -0,0 +1,62 @@
+# orjson-backed JSON codec for model JSONFields and provider API payloads
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class ORJSONEncoder(json.JSONEncoder):
+    """
+    JSONField encoder that writes values with orjson.
+    
+    Anything orjson refuses (integers wider than 64 bits, unsupported types) goes
+    through the stdlib encoder, as does everything when orjson is not installed.
+    """
+    
+    def encode(self, o):
+        if orjson is not None:
+            try:
+                return orjson.dumps(o, option=orjson.OPT_NON_STR_KEYS).decode()
+            except TypeError:
+                pass
+        return super().encode(o)
+
+
+class ORJSONDecoder(json.JSONDecoder):
+    """
+    JSONField decoder that parses column values with orjson.
+    
+    Falls back to the stdlib decoder for documents orjson rejects (NaN/Infinity
+    literals) or when orjson is not installed.
+    """
+    
+    def decode(self, s, *args, **kwargs):
+        if orjson is not None:
+            try:
+                return orjson.loads(s)
+            except orjson.JSONDecodeError:
+                pass
+        return super().decode(s, *args, **kwargs)
+
+
+def encode_json(obj) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, ready to send as a request body"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def decode_json(data):
+    """Parse a JSON document from bytes, bytearray or str"""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
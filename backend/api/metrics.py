@@ -0,0 +1,20 @@
+# Shared metric kernels for TTS evaluations
+
+import numpy as np
+
+
+def chunk_delay_stats(timings, ddof=0):
+    """
+    Inter-chunk delay statistics for a sequence of chunk arrival times.
+    
+    Returns (min, max, mean, std) of the delays between consecutive chunks,
+    or None when there are fewer than two timings. The timings are reduced as
+    one contiguous float64 array so every statistic runs in native code.
+    """
+    timings = np.asarray(timings, dtype=np.float64)
+    if timings.size < 2:
+        return None
+    
+    delays = np.diff(timings)
+    std = float(delays.std(ddof=ddof)) if delays.size > ddof else 0.0
+    return float(delays.min()), float(delays.max()), float(delays.mean()), std
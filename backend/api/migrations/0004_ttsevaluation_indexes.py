@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-15 22:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_ttsevaluation_voice_name'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ttsevaluation',
+            index=models.Index(fields=['session', 'provider'], name='eval_sess_prov_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ttsevaluation',
+            index=models.Index(fields=['provider', '-created_at'], name='eval_prov_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ttsevaluation',
+            index=models.Index(condition=models.Q(('success', True)), fields=['session'], name='eval_success_idx'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.7 on 2026-10-15 22:40
+
+from django.db import migrations, models
+import numpy as np
+
+
+def pack_chunk_timings(apps, schema_editor):
+    TTSEvaluation = apps.get_model('api', 'TTSEvaluation')
+    for evaluation in TTSEvaluation.objects.exclude(chunk_timings=[]).only('id', 'chunk_timings').iterator():
+        evaluation.chunk_timings_bin = np.asarray(evaluation.chunk_timings, dtype=np.float32).tobytes()
+        evaluation.save(update_fields=['chunk_timings_bin'])
+
+
+def unpack_chunk_timings(apps, schema_editor):
+    TTSEvaluation = apps.get_model('api', 'TTSEvaluation')
+    for evaluation in TTSEvaluation.objects.exclude(chunk_timings_bin=b'').only('id', 'chunk_timings_bin').iterator():
+        timings = np.frombuffer(bytes(evaluation.chunk_timings_bin), dtype=np.float32)
+        evaluation.chunk_timings = np.round(timings.astype(np.float64), 3).tolist()
+        evaluation.save(update_fields=['chunk_timings'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_ttsevaluation_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ttsevaluation',
+            name='chunk_timings_bin',
+            field=models.BinaryField(blank=True, default=b'', help_text='Packed float32 chunk arrival times'),
+        ),
+        migrations.RunPython(pack_chunk_timings, unpack_chunk_timings),
+        migrations.RemoveField(
+            model_name='ttsevaluation',
+            name='chunk_timings',
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.7 on 2026-10-15 22:49
+
+import api.jsoncodec
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_pack_chunk_timings'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='benchmarkrun',
+            name='results_summary',
+            field=models.JSONField(blank=True, decoder=api.jsoncodec.ORJSONDecoder, default=dict, encoder=api.jsoncodec.ORJSONEncoder),
+        ),
+        migrations.AlterField(
+            model_name='benchmarkrun',
+            name='test_texts',
+            field=models.JSONField(decoder=api.jsoncodec.ORJSONDecoder, default=list, encoder=api.jsoncodec.ORJSONEncoder, help_text='Array of test texts'),
+        ),
+        migrations.AlterField(
+            model_name='ttsevaluation',
+            name='request_params',
+            field=models.JSONField(blank=True, decoder=api.jsoncodec.ORJSONDecoder, default=dict, encoder=api.jsoncodec.ORJSONEncoder),
+        ),
+        migrations.AlterField(
+            model_name='ttsevaluation',
+            name='response_headers',
+            field=models.JSONField(blank=True, decoder=api.jsoncodec.ORJSONDecoder, default=dict, encoder=api.jsoncodec.ORJSONEncoder),
+        ),
+    ]
@@ -2,8 +2,12 @@
 
 from django.db import models
 from django.utils import timezone
+import numpy as np
 import uuid
 
+from .jsoncodec import ORJSONEncoder, ORJSONDecoder
+from .metrics import chunk_delay_stats
+
 
 class TTSProvider(models.Model):
     """Configuration for TTS service providers"""
@@ -79,9 +83,22 @@ class Voice(models.Model):
         return f"{self.provider.name} - {self.name}"
 
 
+class EvaluationSessionQuerySet(models.QuerySet):
+    """QuerySet for sessions"""
+    
+    def with_counts(self):
+        """Annotate evaluation and success counts (read by the count properties)"""
+        return self.annotate(
+            eval_count=models.Count('evaluations'),
+            success_count=models.Count('evaluations', filter=models.Q(evaluations__success=True)),
+        )
+
+
 class EvaluationSession(models.Model):
     """A session containing multiple TTS synthesis evaluations"""
     
+    objects = EvaluationSessionQuerySet.as_manager()
+    
     # Unique session identifier
     session_id = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
     
@@ -115,16 +132,50 @@ class EvaluationSession(models.Model):
     
     @property
     def evaluation_count(self):
+        # Prefer the count annotated by EvaluationSessionQuerySet.with_counts()
+        eval_count = getattr(self, 'eval_count', None)
+        if eval_count is not None:
+            return eval_count
         return self.evaluations.count()
     
     @property
     def successful_evaluations(self):
+        success_count = getattr(self, 'success_count', None)
+        if success_count is not None:
+            return success_count
         return self.evaluations.filter(success=True).count()
 
 
+class TTSEvaluationQuerySet(models.QuerySet):
+    """QuerySet for evaluations; heavy payload columns are opt-in"""
+    
+    # Columns that can hold megabytes per row and are not needed for metrics
+    HEAVY_FIELDS = ('audio_base64', 'chunk_timings_bin', 'response_headers', 'request_params')
+    
+    def without_payload(self):
+        return self.defer(*self.HEAVY_FIELDS)
+    
+    def with_payload(self, *fields):
+        """Load the given payload columns; the rest of HEAVY_FIELDS stay deferred"""
+        return self.defer(None).defer(*[f for f in self.HEAVY_FIELDS if f not in fields])
+    
+    def with_audio(self):
+        """Load every column, including the audio and raw request/response data"""
+        return self.with_payload(*self.HEAVY_FIELDS)
+
+
+class TTSEvaluationManager(models.Manager.from_queryset(TTSEvaluationQuerySet)):
+    """Default manager that leaves the payload columns out of every query"""
+    
+    def get_queryset(self):
+        return super().get_queryset().without_payload()
+
+
 class TTSEvaluation(models.Model):
     """Individual TTS synthesis evaluation with detailed metrics"""
     
+    objects = TTSEvaluationManager()
+    
     # Link to session
     session = models.ForeignKey(EvaluationSession, on_delete=models.CASCADE, related_name='evaluations')
     
@@ -191,8 +242,8 @@ class TTSEvaluation(models.Model):
     # Average chunk size in bytes
     avg_chunk_size = models.FloatField(null=True, blank=True, help_text='Average chunk size in bytes')
     
-    # Chunk timing data as JSON array
-    chunk_timings = models.JSONField(default=list, blank=True, help_text='Array of chunk arrival times')
+    # Chunk arrival times packed as contiguous float32 values (see chunk_timings)
+    chunk_timings_bin = models.BinaryField(default=b'', blank=True, help_text='Packed float32 chunk arrival times')
     
     # ========== PLAYBACK JITTER METRICS ==========
     
@@ -211,10 +262,10 @@ class TTSEvaluation(models.Model):
     # ========== REQUEST/RESPONSE METADATA ==========
     
     # Request parameters as JSON
-    request_params = models.JSONField(default=dict, blank=True)
+    request_params = models.JSONField(encoder=ORJSONEncoder, decoder=ORJSONDecoder, default=dict, blank=True)
     
     # Response headers as JSON
-    response_headers = models.JSONField(default=dict, blank=True)
+    response_headers = models.JSONField(encoder=ORJSONEncoder, decoder=ORJSONDecoder, default=dict, blank=True)
     
     # Character count of input text
     character_count = models.IntegerField(default=0)
@@ -243,11 +294,31 @@ class TTSEvaluation(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Per-session, per-provider aggregation (session detail / stats)
+            models.Index(fields=['session', 'provider'], name='eval_sess_prov_idx'),
+            # Provider metric windows ordered by recency
+            models.Index(fields=['provider', '-created_at'], name='eval_prov_created_idx'),
+            # Successful evaluations only (successful_evaluations, provider metrics)
+            models.Index(fields=['session'], condition=models.Q(success=True), name='eval_success_idx'),
+        ]
 
     def __str__(self):
         status = "✓" if self.success else "✗"
         return f"{status} {self.provider.name} - {self.voice_id} ({self.total_synthesis_time or 'N/A'}ms)"
     
+    @property
+    def chunk_timings(self):
+        """Chunk arrival times in milliseconds as a list of floats"""
+        return np.round(self._chunk_timings_array().astype(np.float64), 3).tolist()
+    
+    @chunk_timings.setter
+    def chunk_timings(self, timings):
+        self.chunk_timings_bin = np.asarray(timings or [], dtype=np.float32).tobytes()
+    
+    def _chunk_timings_array(self):
+        return np.frombuffer(bytes(self.chunk_timings_bin or b''), dtype=np.float32)
+    
     def calculate_derived_metrics(self):
         """Calculate derived metrics from raw measurements"""
         if self.total_synthesis_time and self.total_synthesis_time > 0:
@@ -259,22 +330,11 @@ class TTSEvaluation(models.Model):
             if self.audio_duration:
                 self.realtime_factor = self.audio_duration / (self.total_synthesis_time / 1000)
         
-        # Calculate jitter from chunk timings
-        if self.chunk_timings and len(self.chunk_timings) > 1:
-            delays = []
-            for i in range(1, len(self.chunk_timings)):
-                delay = self.chunk_timings[i] - self.chunk_timings[i-1]
-                delays.append(delay)
-            
-            if delays:
-                self.min_chunk_delay = min(delays)
-                self.max_chunk_delay = max(delays)
-                self.avg_chunk_delay = sum(delays) / len(delays)
-                
-                # Jitter is the standard deviation of delays
-                mean_delay = self.avg_chunk_delay
-                variance = sum((d - mean_delay) ** 2 for d in delays) / len(delays)
-                self.playback_jitter = variance ** 0.5
+        # Calculate jitter from chunk timings, reducing the packed buffer directly
+        stats = chunk_delay_stats(self._chunk_timings_array())
+        if stats is not None:
+            # Jitter is the standard deviation of delays
+            self.min_chunk_delay, self.max_chunk_delay, self.avg_chunk_delay, self.playback_jitter = stats
 
 
 class BenchmarkRun(models.Model):
@@ -290,7 +350,9 @@ class BenchmarkRun(models.Model):
     description = models.TextField(blank=True)
     
     # Test texts used
-    test_texts = models.JSONField(default=list, help_text='Array of test texts')
+    test_texts = models.JSONField(
+        default=list, encoder=ORJSONEncoder, decoder=ORJSONDecoder, help_text='Array of test texts'
+    )
     
     # Providers included
     providers = models.ManyToManyField(TTSProvider, related_name='benchmarks')
@@ -309,7 +371,7 @@ class BenchmarkRun(models.Model):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     
     # Aggregated results as JSON
-    results_summary = models.JSONField(default=dict, blank=True)
+    results_summary = models.JSONField(encoder=ORJSONEncoder, decoder=ORJSONDecoder, default=dict, blank=True)
     
     # Timestamps
     created_at = models.DateTimeField(default=timezone.now)
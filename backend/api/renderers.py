@@ -0,0 +1,51 @@
+# Response renderers for the TTS Evaluation Platform API
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson.
+    
+    Produces the same documents as DRF's JSONRenderer (UTC datetimes end in 'Z',
+    non-ASCII is emitted as UTF-8) but encodes in native code. Types orjson does
+    not know are handed to DRF's encoder; without orjson installed this simply
+    behaves like JSONRenderer.
+    """
+    
+    _encoder = JSONEncoder()
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        
+        if data is None:
+            return b''
+        
+        option = orjson.OPT_UTC_Z | orjson.OPT_SERIALIZE_NUMPY
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            option |= orjson.OPT_INDENT_2
+        
+        return orjson.dumps(data, default=self._encoder.default, option=option)
+
+
+def stream_json_array(rows, renderer=None):
+    """Yield a JSON array one encoded row at a time, for StreamingHttpResponse bodies.
+    
+    The concatenated chunks are byte-identical to rendering the whole list at once,
+    but only one row is ever held as encoded output.
+    """
+    renderer = renderer or ORJSONRenderer()
+    yield b'['
+    for i, row in enumerate(rows):
+        if i:
+            yield b','
+        yield renderer.render(row)
+    yield b']'
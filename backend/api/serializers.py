@@ -1,5 +1,12 @@
 # Serializers for TTS Evaluation Platform API
 
+import copy
+
+from django.conf import settings
+from django.core.validators import MinValueValidator, MaxValueValidator
+from django.db import models
+from django.db.models import BooleanField, ExpressionWrapper, F, Q
+from django.urls import reverse
 from rest_framework import serializers
 from .models import (
     TTSProvider, Voice, EvaluationSession, TTSEvaluation, 
@@ -7,11 +14,71 @@ from .models import (
 )
 
 
+# ========== Base Serializers ==========
+
+class CachedFieldsMixin:
+    """Build the field map once per serializer class and hand each instance a copy.
+    
+    ModelSerializer.get_fields() re-introspects the model and rebuilds every field
+    on each instantiation; copying the prebuilt map is roughly twice as fast.
+    """
+    
+    _field_cache = {}
+    
+    def get_fields(self):
+        cls = type(self)
+        fields = CachedFieldsMixin._field_cache.get(cls)
+        if fields is None:
+            fields = CachedFieldsMixin._field_cache[cls] = super().get_fields()
+        return copy.deepcopy(fields)
+
+
+class FastDateTimeField(serializers.DateTimeField):
+    """ISO 8601 DateTimeField that skips format lookup and timezone re-conversion.
+    
+    Stored datetimes are already aware and in UTC (USE_TZ with TIME_ZONE='UTC'),
+    so the output matches DateTimeField's ('...Z') without the per-value overhead.
+    """
+    
+    def to_representation(self, value):
+        if not value:
+            return None
+        if isinstance(value, str):
+            return value
+        value = value.isoformat()
+        if value.endswith('+00:00'):
+            value = value[:-6] + 'Z'
+        return value
+
+
+class FastFloatField(serializers.FloatField):
+    """FloatField that passes stored floats through instead of re-coercing each one.
+    
+    Model FloatField values loaded from the database are already floats (or None,
+    which the serializer handles before calling the field), so float() is only
+    applied to anything else.
+    """
+    
+    def to_representation(self, value):
+        if type(value) is float:
+            return value
+        return float(value)
+
+
+class FastFieldsMixin:
+    """Map model DateTimeFields and FloatFields to their fast output fields"""
+    serializer_field_mapping = {
+        **serializers.ModelSerializer.serializer_field_mapping,
+        models.DateTimeField: FastDateTimeField,
+        models.FloatField: FastFloatField,
+    }
+
+
 # ========== Provider Serializers ==========
 
-class TTSProviderSerializer(serializers.ModelSerializer):
-    """Serializer for TTS Provider model"""
-    voice_count = serializers.SerializerMethodField()
+class TTSProviderSerializer(CachedFieldsMixin, FastFieldsMixin, serializers.ModelSerializer):
+    """Serializer for TTS Provider model (queryset must annotate available_voice_count)"""
+    voice_count = serializers.IntegerField(source='available_voice_count', read_only=True)
     
     class Meta:
         model = TTSProvider
@@ -20,15 +87,12 @@ class TTSProviderSerializer(serializers.ModelSerializer):
             'api_base_url', 'config', 'voice_count', 'created_at', 'updated_at'
         ]
         read_only_fields = ['created_at', 'updated_at']
-    
-    def get_voice_count(self, obj):
-        return obj.voices.filter(is_available=True).count()
 
 
 class VoiceSerializer(serializers.ModelSerializer):
-    """Serializer for Voice model"""
-    provider_name = serializers.CharField(source='provider.name', read_only=True)
-    provider_id_str = serializers.CharField(source='provider.provider_id', read_only=True)
+    """Serializer for Voice model (queryset must go through setup_eager_loading)"""
+    provider_name = serializers.CharField(read_only=True)
+    provider_id_str = serializers.CharField(read_only=True)
     
     class Meta:
         model = Voice
@@ -36,6 +100,14 @@ class VoiceSerializer(serializers.ModelSerializer):
             'id', 'provider', 'provider_name', 'provider_id_str', 'voice_id', 
             'name', 'language', 'gender', 'description', 'is_available', 'settings'
         ]
+    
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Annotate the provider columns read by provider_name/provider_id_str"""
+        return queryset.annotate(
+            provider_name=F('provider__name'),
+            provider_id_str=F('provider__provider_id'),
+        )
 
 
 class VoiceListSerializer(serializers.Serializer):
@@ -51,11 +123,58 @@ class VoiceListSerializer(serializers.Serializer):
 
 # ========== Evaluation Serializers ==========
 
-class TTSEvaluationSerializer(serializers.ModelSerializer):
-    """Full serializer for TTS Evaluation model"""
-    provider_name = serializers.CharField(source='provider.name', read_only=True)
-    provider_id_str = serializers.CharField(source='provider.provider_id', read_only=True)
-    voice_name = serializers.CharField(source='voice.name', read_only=True, allow_null=True)
+def _field_list_param(request, param):
+    """Field names from a comma-separated query parameter, or None if absent"""
+    value = request.query_params.get(param) if request is not None else None
+    if not value:
+        return None
+    return {f.strip() for f in value.split(',') if f.strip()}
+
+
+def include_field(request, name, opt_in=False):
+    """Whether a field survives the ?fields= / ?omit= query parameters.
+    
+    Opt-in fields must additionally be listed in ?include=.
+    """
+    allowed = _field_list_param(request, 'fields')
+    omitted = _field_list_param(request, 'omit') or ()
+    if opt_in and name not in (_field_list_param(request, 'include') or ()):
+        return False
+    return (not allowed or name in allowed) and name not in omitted
+
+
+def evaluation_audio_url(request, evaluation_id):
+    """Absolute URL of the endpoint serving an evaluation's stored audio (just the path without a request)"""
+    url = reverse('get_evaluation_audio', args=[evaluation_id])
+    return request.build_absolute_uri(url) if request else url
+
+
+class SparseFieldsMixin:
+    """Restrict output with the comma-separated ?fields= and ?omit= query parameters.
+    
+    Fields are resolved lazily so the filter also applies when the serializer
+    is nested (the request is read from the root serializer's context).
+    """
+    
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get('request')
+        for name in list(fields):
+            if not include_field(request, name):
+                fields.pop(name)
+        return fields
+
+
+class TTSEvaluationSerializer(SparseFieldsMixin, CachedFieldsMixin, FastFieldsMixin, serializers.ModelSerializer):
+    """Full serializer for TTS Evaluation model (queryset must go through setup_eager_loading)"""
+    # Flat aliases annotated by setup_eager_loading rather than dotted source= traversals;
+    # voice_name reports the linked Voice row, whose alias can't reuse the model column name
+    provider_name = serializers.CharField(read_only=True)
+    provider_id_str = serializers.CharField(read_only=True)
+    voice_name = serializers.CharField(source='linked_voice_name', read_only=True, allow_null=True)
+    # Embedded audio is opt-in (?include=audio_base64); otherwise clients follow audio_url
+    audio_base64 = serializers.SerializerMethodField()
+    audio_url = serializers.SerializerMethodField()
     
     class Meta:
         model = TTSEvaluation
@@ -75,16 +194,53 @@ class TTSEvaluationSerializer(serializers.ModelSerializer):
             # Computed metrics
             'chars_per_second', 'realtime_factor',
             # Audio data
-            'audio_file_path', 'audio_base64',
+            'audio_file_path', 'audio_url', 'audio_base64',
             # Timestamps
             'created_at'
         ]
         read_only_fields = ['created_at']
+    
+    # Serializer fields backed by payload columns the default manager defers
+    PAYLOAD_COLUMNS = {
+        'chunk_timings': 'chunk_timings_bin',
+        'request_params': 'request_params',
+        'response_headers': 'response_headers',
+        'audio_base64': 'audio_base64',
+    }
+    
+    # Payload fields only serialized when requested with ?include=
+    OPT_IN_FIELDS = {'audio_base64'}
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset, request=None):
+        """Annotate the provider and voice columns read by the alias fields, and load only
+        the payload columns that ?fields= / ?omit= / ?include= leave in the response"""
+        columns = [
+            column for name, column in cls.PAYLOAD_COLUMNS.items()
+            if include_field(request, name, opt_in=name in cls.OPT_IN_FIELDS)
+        ]
+        return queryset.annotate(
+            provider_name=F('provider__name'),
+            provider_id_str=F('provider__provider_id'),
+            linked_voice_name=F('voice__name'),
+            # Whether audio is stored, without loading the deferred audio column
+            has_audio=ExpressionWrapper(~Q(audio_base64=''), output_field=BooleanField()),
+        ).with_payload(*columns)
+    
+    def get_audio_base64(self, obj):
+        if include_field(self.context.get('request'), 'audio_base64', opt_in=True):
+            return obj.audio_base64
+        return None
+    
+    def get_audio_url(self, obj):
+        if not obj.has_audio:
+            return None
+        return evaluation_audio_url(self.context.get('request'), obj.id)
 
 
-class TTSEvaluationSummarySerializer(serializers.ModelSerializer):
-    """Lightweight serializer for evaluation summaries"""
-    provider_name = serializers.CharField(source='provider.name', read_only=True)
+class TTSEvaluationSummarySerializer(SparseFieldsMixin, CachedFieldsMixin, FastFieldsMixin, serializers.ModelSerializer):
+    """Lightweight serializer for evaluation summaries (queryset must go through setup_eager_loading)"""
+    provider_name = serializers.CharField(read_only=True)
     
     class Meta:
         model = TTSEvaluation
@@ -93,9 +249,21 @@ class TTSEvaluationSummarySerializer(serializers.ModelSerializer):
             'time_to_first_audio', 'total_synthesis_time', 'playback_jitter',
             'audio_duration', 'realtime_factor', 'created_at'
         ]
+    
+    # Fields read from queryset annotations rather than model columns
+    ANNOTATIONS = {'provider_name': F('provider__name')}
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset, request=None):
+        """Load only the columns of the fields this response will contain, annotating
+        the provider name when provider_name is one of them"""
+        fields = [name for name in cls.Meta.fields if include_field(request, name)]
+        annotations = {name: cls.ANNOTATIONS[name] for name in fields if name in cls.ANNOTATIONS}
+        columns = ['session'] + [name for name in fields if name not in annotations]
+        return queryset.annotate(**annotations).only(*columns)
 
 
-class EvaluationSessionSerializer(serializers.ModelSerializer):
+class EvaluationSessionSerializer(CachedFieldsMixin, FastFieldsMixin, serializers.ModelSerializer):
     """Full serializer for Evaluation Session model"""
     evaluations = TTSEvaluationSummarySerializer(many=True, read_only=True)
     evaluation_count = serializers.IntegerField(read_only=True)
@@ -111,7 +279,7 @@ class EvaluationSessionSerializer(serializers.ModelSerializer):
         read_only_fields = ['session_id', 'created_at']
 
 
-class EvaluationSessionListSerializer(serializers.ModelSerializer):
+class EvaluationSessionListSerializer(FastFieldsMixin, serializers.ModelSerializer):
     """Lightweight serializer for session listing"""
     evaluation_count = serializers.IntegerField(read_only=True)
     successful_evaluations = serializers.IntegerField(read_only=True)
@@ -122,10 +290,27 @@ class EvaluationSessionListSerializer(serializers.ModelSerializer):
             'id', 'session_id', 'name', 'text', 'status',
             'created_at', 'completed_at', 'evaluation_count', 'successful_evaluations'
         ]
+    
+    def to_representation(self, instance):
+        # Listing without with_counts() silently falls back to two COUNTs per session
+        if settings.DEBUG:
+            assert hasattr(instance, 'eval_count'), (
+                'EvaluationSessionListSerializer expects a queryset annotated with with_counts()'
+            )
+        return super().to_representation(instance)
 
 
 # ========== Request Serializers ==========
 
+# Range validators shared by the request serializers. Fields deep-copy their declared
+# validators lists by reference, so these are built once instead of on every request
+# (min_value/max_value would construct a fresh pair per field instantiation).
+SPEAKING_RATE_VALIDATORS = [MinValueValidator(0.25), MaxValueValidator(4.0)]
+PITCH_VALIDATORS = [MinValueValidator(-20.0), MaxValueValidator(20.0)]
+UNIT_INTERVAL_VALIDATORS = [MinValueValidator(0.0), MaxValueValidator(1.0)]
+ITERATIONS_VALIDATORS = [MinValueValidator(1), MaxValueValidator(10)]
+
+
 class SynthesisRequestSerializer(serializers.Serializer):
     """Serializer for TTS synthesis requests"""
     text = serializers.CharField(max_length=5000, help_text='Text to synthesize')
@@ -136,51 +321,57 @@ class SynthesisRequestSerializer(serializers.Serializer):
     # Optional provider-specific parameters
     model_id = serializers.CharField(max_length=100, required=False, allow_blank=True)
     language_code = serializers.CharField(max_length=20, required=False, default='en-US')
-    speaking_rate = serializers.FloatField(min_value=0.25, max_value=4.0, required=False, default=1.0)
-    pitch = serializers.FloatField(min_value=-20.0, max_value=20.0, required=False, default=0.0)
+    speaking_rate = serializers.FloatField(validators=SPEAKING_RATE_VALIDATORS, required=False, default=1.0)
+    pitch = serializers.FloatField(validators=PITCH_VALIDATORS, required=False, default=0.0)
     
     # ElevenLabs specific
-    stability = serializers.FloatField(min_value=0.0, max_value=1.0, required=False, default=0.5)
-    similarity_boost = serializers.FloatField(min_value=0.0, max_value=1.0, required=False, default=0.75)
+    stability = serializers.FloatField(validators=UNIT_INTERVAL_VALIDATORS, required=False, default=0.5)
+    similarity_boost = serializers.FloatField(validators=UNIT_INTERVAL_VALIDATORS, required=False, default=0.75)
+
+
+class ProviderConfigSerializer(serializers.Serializer):
+    """Serializer for one provider entry of a batch, evaluation or benchmark request"""
+    provider_id = serializers.CharField(max_length=50)
+    voice_id = serializers.CharField(max_length=100, allow_blank=True)
+    options = serializers.DictField(required=False, default=dict)
 
 
 class BatchSynthesisRequestSerializer(serializers.Serializer):
     """Serializer for batch TTS synthesis requests"""
     text = serializers.CharField(max_length=5000, help_text='Text to synthesize')
     providers = serializers.ListField(
-        child=serializers.DictField(),
+        child=ProviderConfigSerializer(),
         min_length=1,
         max_length=10,
         help_text='List of provider configurations'
     )
     streaming = serializers.BooleanField(default=False)
     session_name = serializers.CharField(max_length=200, required=False, allow_blank=True)
-    
-    def validate_providers(self, value):
-        """Validate provider configurations"""
-        for provider_config in value:
-            if 'provider_id' not in provider_config:
-                raise serializers.ValidationError("Each provider must have a 'provider_id'")
-            if 'voice_id' not in provider_config:
-                raise serializers.ValidationError("Each provider must have a 'voice_id'")
-        return value
+    stream_results = serializers.BooleanField(
+        default=False,
+        help_text='Respond with NDJSON, one line per provider result as it completes'
+    )
 
 
 class EvaluationRequestSerializer(serializers.Serializer):
     """Serializer for evaluation requests"""
     text = serializers.CharField(max_length=5000)
     provider_configs = serializers.ListField(
-        child=serializers.DictField(),
+        child=ProviderConfigSerializer(),
         min_length=1,
         max_length=10
     )
     streaming = serializers.BooleanField(default=False)
     session_name = serializers.CharField(max_length=200, required=False, allow_blank=True)
-    iterations = serializers.IntegerField(min_value=1, max_value=10, default=1)
+    iterations = serializers.IntegerField(validators=ITERATIONS_VALIDATORS, default=1)
 
 
 # ========== Response Serializers ==========
 
+# These document the synthesis response shapes. The views build the same structure as
+# plain dicts and hand it straight to the renderer (one orjson pass over the whole
+# payload), so none of them is instantiated at request time.
+
 class MetricsResponseSerializer(serializers.Serializer):
     """Serializer for synthesis metrics response"""
     # Timing metrics (ms)
@@ -214,6 +405,7 @@ class MetricsResponseSerializer(serializers.Serializer):
     # Computed metrics
     chars_per_second = serializers.FloatField(allow_null=True)
     realtime_factor = serializers.FloatField(allow_null=True)
+    cached = serializers.BooleanField()
 
 
 class SynthesisResponseSerializer(serializers.Serializer):
@@ -234,53 +426,64 @@ class BatchSynthesisResponseSerializer(serializers.Serializer):
     session_id = serializers.UUIDField()
     text = serializers.CharField()
     results = SynthesisResponseSerializer(many=True)
-    timestamp = serializers.DateTimeField()
+    timestamp = FastDateTimeField()
 
 
 # ========== Benchmark Serializers ==========
 
-class BenchmarkRunSerializer(serializers.ModelSerializer):
-    """Full serializer for Benchmark Run model"""
+class BenchmarkRunSerializer(CachedFieldsMixin, FastFieldsMixin, serializers.ModelSerializer):
+    """Read-only serializer for Benchmark Run model.
+    
+    Benchmarks are created through BenchmarkRequestSerializer, so this one carries no
+    write-side fields and only ever binds output.
+    """
     providers = TTSProviderSerializer(many=True, read_only=True)
-    provider_ids = serializers.ListField(
-        child=serializers.IntegerField(),
-        write_only=True,
-        required=False
-    )
     
     class Meta:
         model = BenchmarkRun
         fields = [
             'id', 'benchmark_id', 'name', 'description', 'test_texts',
-            'providers', 'provider_ids', 'iterations', 'status',
+            'providers', 'iterations', 'status',
             'results_summary', 'created_at', 'started_at', 'completed_at'
         ]
-        read_only_fields = ['benchmark_id', 'status', 'results_summary', 'created_at', 'started_at', 'completed_at']
+        read_only_fields = fields
 
 
 class BenchmarkRequestSerializer(serializers.Serializer):
     """Serializer for benchmark requests"""
     name = serializers.CharField(max_length=200)
     description = serializers.CharField(required=False, allow_blank=True)
+    # Per-text length is checked once over the list in validate_test_texts rather
+    # than through a MaxLengthValidator on every child
     test_texts = serializers.ListField(
-        child=serializers.CharField(max_length=5000),
+        child=serializers.CharField(),
         min_length=1,
         max_length=20
     )
     provider_configs = serializers.ListField(
-        child=serializers.DictField(),
+        child=ProviderConfigSerializer(),
         min_length=1,
         max_length=10
     )
-    iterations = serializers.IntegerField(min_value=1, max_value=10, default=3)
+    iterations = serializers.IntegerField(validators=ITERATIONS_VALIDATORS, default=3)
+    
+    MAX_TEXT_LENGTH = 5000
+    
+    def validate_test_texts(self, value):
+        """Reject any test text longer than MAX_TEXT_LENGTH characters"""
+        if any(len(text) > self.MAX_TEXT_LENGTH for text in value):
+            raise serializers.ValidationError(
+                f'Each test text must be at most {self.MAX_TEXT_LENGTH} characters.'
+            )
+        return value
 
 
 # ========== Aggregate Metrics Serializers ==========
 
-class ProviderMetricsAggregateSerializer(serializers.ModelSerializer):
-    """Serializer for Provider Metrics Aggregate model"""
-    provider_name = serializers.CharField(source='provider.name', read_only=True)
-    provider_id_str = serializers.CharField(source='provider.provider_id', read_only=True)
+class ProviderMetricsAggregateSerializer(FastFieldsMixin, serializers.ModelSerializer):
+    """Serializer for Provider Metrics Aggregate model (queryset must go through setup_eager_loading)"""
+    provider_name = serializers.CharField(read_only=True)
+    provider_id_str = serializers.CharField(read_only=True)
     
     class Meta:
         model = ProviderMetricsAggregate
@@ -292,6 +495,14 @@ class ProviderMetricsAggregateSerializer(serializers.ModelSerializer):
             'p50_synthesis_time', 'p95_synthesis_time', 'p99_synthesis_time',
             'min_synthesis_time', 'max_synthesis_time', 'updated_at'
         ]
+    
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Annotate the provider columns read by provider_name/provider_id_str"""
+        return queryset.annotate(
+            provider_name=F('provider__name'),
+            provider_id_str=F('provider__provider_id'),
+        )
 
 
 class ComparisonMetricsSerializer(serializers.Serializer):
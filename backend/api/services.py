@@ -1,33 +1,252 @@
 # TTS Service Providers - Interface with multiple TTS APIs and measure latency metrics
 
+import asyncio
 import os
+import random
 import time
 import base64
+import binascii
+import hashlib
 import json
-import statistics
+import logging
+import math
+import queue
+import re
 import struct
+import threading
 import uuid
+from array import array
+from collections import defaultdict
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, field
+from functools import lru_cache
+from asgiref.sync import async_to_sync, sync_to_async
+from typing import AsyncIterator, Dict, Iterator, List, Mapping, Optional, Tuple, Any
+from dataclasses import dataclass, field, fields
 from io import BytesIO
 from django.conf import settings
+from django.core.cache import cache
 from dotenv import load_dotenv
 from pathlib import Path
+from .jsoncodec import decode_json, encode_json
+
+_log = logging.getLogger(__name__)
+
+# pydub is optional: it is only needed for non-MP3 durations and PCM-to-MP3 conversion
+try:
+    from pydub import AudioSegment
+except ImportError:
+    AudioSegment = None
+
+# boto3 is optional: without it Amazon Polly runs in demo mode
+try:
+    import boto3
+    from botocore.config import Config as BotoConfig
+except ImportError:
+    boto3 = None
 
 # Load environment variables
 load_dotenv()
 backend_dir = Path(__file__).resolve().parent.parent
 
 
-def get_audio_duration(audio_data: bytes, audio_format: str = 'mp3') -> Optional[float]:
+@dataclass(frozen=True)
+class ProviderEnv:
+    """Provider credentials and regions, read from the environment once at import"""
+    elevenlabs_api_key: Optional[str] = None
+    google_api_key: Optional[str] = None
+    google_credentials_path: Optional[str] = None
+    azure_api_key: Optional[str] = None
+    azure_region: str = 'eastus'
+    aws_access_key: Optional[str] = None
+    aws_secret_key: Optional[str] = None
+    aws_region: str = 'us-east-1'
+    openai_api_key: Optional[str] = None
+    
+    @classmethod
+    def from_env(cls) -> 'ProviderEnv':
+        return cls(
+            elevenlabs_api_key=os.getenv('ELEVENLABS_API_KEY'),
+            google_api_key=os.getenv('GOOGLE_TTS_API_KEY'),
+            google_credentials_path=os.getenv('GOOGLE_APPLICATION_CREDENTIALS'),
+            azure_api_key=os.getenv('AZURE_TTS_API_KEY'),
+            azure_region=os.getenv('AZURE_TTS_REGION', 'eastus'),
+            aws_access_key=os.getenv('AWS_ACCESS_KEY_ID'),
+            aws_secret_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
+            aws_region=os.getenv('AWS_REGION', 'us-east-1'),
+            openai_api_key=os.getenv('OPENAI_API_KEY'),
+        )
+
+
+# Read by each provider's __init__; rebind it (e.g. dataclasses.replace) before providers are created to override
+PROVIDER_ENV = ProviderEnv.from_env()
+
+# Timestamps are taken with time.perf_counter_ns(); metrics are reported in milliseconds.
+# Chunk gaps are network reads (tens of ms), so the clock's ~100 ns read cost is far below noise.
+NS_PER_MS = 1_000_000
+
+
+# MPEG audio Layer III header tables, indexed by the header's version bits
+# (0 = MPEG 2.5, 2 = MPEG 2, 3 = MPEG 1; 1 is reserved)
+MP3_BITRATES_KBPS = {
+    3: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    0: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+MP3_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    0: (11025, 12000, 8000),
+}
+
+# How far into the data to look for the first frame header
+MP3_SYNC_SEARCH_LIMIT = 64 * 1024
+
+
+def _mp3_frame_header(data, pos: int) -> Optional[Tuple[int, int, int, int, int]]:
+    """Parse a Layer III frame header at pos into (version, bitrate_kbps, sample_rate,
+    channel_mode, frame_length), or None if there is no valid header there"""
+    if pos + 4 > len(data) or data[pos] != 0xFF or data[pos + 1] & 0xE0 != 0xE0:
+        return None
+    b1, b2, b3 = data[pos + 1], data[pos + 2], data[pos + 3]
+    version = (b1 >> 3) & 0x03
+    layer = (b1 >> 1) & 0x03
+    bitrate_index = b2 >> 4
+    rate_index = (b2 >> 2) & 0x03
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    bitrate = MP3_BITRATES_KBPS[version][bitrate_index]
+    sample_rate = MP3_SAMPLE_RATES[version][rate_index]
+    padding = (b2 >> 1) & 0x01
+    frame_length = (144 if version == 3 else 72) * bitrate * 1000 // sample_rate + padding
+    return version, bitrate, sample_rate, b3 >> 6, frame_length
+
+
+def mp3_duration(audio_data) -> Optional[float]:
+    """
+    Duration in seconds of an MP3 stream, read from its frame headers without decoding.
+    
+    Uses the frame count of a Xing/Info or VBRI header when the encoder wrote one
+    (VBR files); otherwise the stream is constant bitrate and the duration follows
+    from its size and the first frame's bitrate. Returns None if no frame is found.
+    """
+    pos = 0
+    # Skip an ID3v2 tag (its size is a 28-bit syncsafe integer, plus an optional footer)
+    if audio_data[:3] == b'ID3' and len(audio_data) >= 10:
+        size = 0
+        for byte in audio_data[6:10]:
+            size = (size << 7) | (byte & 0x7F)
+        pos = 10 + size + (10 if audio_data[5] & 0x10 else 0)
+    
+    # Find the first frame header that is followed by another one (rules out stray 0xFF bytes)
+    limit = min(len(audio_data), pos + MP3_SYNC_SEARCH_LIMIT)
+    header = None
+    while pos < limit:
+        pos = audio_data.find(b'\xff', pos, limit)
+        if pos < 0:
+            return None
+        header = _mp3_frame_header(audio_data, pos)
+        if header:
+            next_pos = pos + header[4]
+            if next_pos + 4 > len(audio_data) or _mp3_frame_header(audio_data, next_pos):
+                break
+        header = None
+        pos += 1
+    if header is None:
+        return None
+    
+    version, bitrate, sample_rate, channel_mode, _ = header
+    samples_per_frame = 1152 if version == 3 else 576
+    
+    # Xing/Info tag sits after the side information of the first frame
+    mono = channel_mode == 3
+    side_info = (17 if mono else 32) if version == 3 else (9 if mono else 17)
+    xing = pos + 4 + side_info
+    if (audio_data[xing:xing + 4] in (b'Xing', b'Info') and len(audio_data) >= xing + 12
+            and audio_data[xing + 7] & 0x01):
+        frames = struct.unpack('>I', audio_data[xing + 8:xing + 12])[0]
+        return frames * samples_per_frame / sample_rate
+    vbri = pos + 36
+    if audio_data[vbri:vbri + 4] == b'VBRI' and len(audio_data) >= vbri + 18:
+        frames = struct.unpack('>I', audio_data[vbri + 14:vbri + 18])[0]
+        return frames * samples_per_frame / sample_rate
+    
+    # Constant bitrate: the frames run from pos to the end, less any 128-byte ID3v1 tag
+    end = len(audio_data)
+    if end - pos >= 128 and audio_data[end - 128:end - 125] == b'TAG':
+        end -= 128
+    return (end - pos) * 8 / (bitrate * 1000)
+
+
+def pcm_wav_header(sample_rate: int) -> bytes:
+    """
+    44-byte WAV header for mono 16-bit PCM at sample_rate.
+    The RIFF and data sizes are left as zero; set_wav_sizes() fills them in.
+    """
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 0, b'WAVE',
+        b'fmt ', 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b'data', 0,
+    )
+
+
+def set_wav_sizes(wav: bytearray):
+    """Write the RIFF and data sizes into a buffer that starts with pcm_wav_header()"""
+    data_size = len(wav) - 44
+    struct.pack_into('<I', wav, 4, 36 + data_size)
+    struct.pack_into('<I', wav, 40, data_size)
+
+
+def wav_duration(audio_data) -> Optional[float]:
+    """
+    Duration in seconds of a RIFF/WAVE file, from its fmt byte rate and data chunk
+    size. Returns None for anything that is not a WAV with both chunks.
+    """
+    if len(audio_data) < 12 or audio_data[:4] != b'RIFF' or audio_data[8:12] != b'WAVE':
+        return None
+    
+    byte_rate = None
+    pos = 12
+    while pos + 8 <= len(audio_data):
+        chunk_id = audio_data[pos:pos + 4]
+        chunk_size = struct.unpack_from('<I', audio_data, pos + 4)[0]
+        if chunk_id == b'fmt ' and pos + 16 <= len(audio_data):
+            byte_rate = struct.unpack_from('<I', audio_data, pos + 16)[0]
+        elif chunk_id == b'data':
+            # Streamed WAVs can leave the size unset; count what is actually there
+            data_size = min(chunk_size, len(audio_data) - pos - 8) or len(audio_data) - pos - 8
+            return data_size / byte_rate if byte_rate else None
+        pos += 8 + chunk_size + (chunk_size & 1)
+    return None
+
+
+def get_audio_duration(audio_data: bytes, audio_format: str = 'mp3', sample_rate: int = 22050) -> Optional[float]:
     """
     Calculate audio duration in seconds from audio data.
-    Uses pydub for accurate duration measurement.
+    Raw PCM (mono, 16-bit at sample_rate) is measured from its length, WAV from its
+    header and MP3 from the frame headers; other formats (or data none of those
+    parsers recognise) are measured with pydub.
     """
+    if audio_format == 'pcm':
+        return len(audio_data) / (sample_rate * 2)
+    
+    if audio_format == 'wav':
+        duration = wav_duration(audio_data)
+        if duration is not None:
+            return duration
+    
+    if audio_format == 'mp3':
+        duration = mp3_duration(audio_data)
+        if duration is not None:
+            return duration
+    
     try:
-        from pydub import AudioSegment
+        if AudioSegment is None:
+            raise ImportError('pydub is not installed')
+        # Decoding is only ever this fallback, so the per-call BytesIO wrapper is not worth pooling
         audio = AudioSegment.from_file(BytesIO(audio_data), format=audio_format)
         return len(audio) / 1000.0  # pydub returns milliseconds
     except Exception as e:
@@ -49,6 +268,37 @@ def get_audio_duration(audio_data: bytes, audio_format: str = 'mp3') -> Optional
         return None
 
 
+@lru_cache(maxsize=32)
+def text_metrics(text: str) -> Tuple[int, int]:
+    """Character and word count of text, memoized since synthesize_multiple sends one text to every provider"""
+    return len(text), len(text.split())
+
+
+# Sentence boundaries used to split long texts, and the batch size they are grouped into
+SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+')
+LONG_TEXT_BATCH_CHARS = 240
+
+
+def split_text_batches(text: str, max_chars: int = LONG_TEXT_BATCH_CHARS) -> List[str]:
+    """
+    Split text at sentence ends and group the sentences into batches of up to
+    max_chars characters. A sentence longer than max_chars becomes its own batch.
+    """
+    batches = []
+    current = ''
+    for sentence in SENTENCE_END_RE.split(text.strip()):
+        if not sentence:
+            continue
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            batches.append(current)
+            current = sentence
+        else:
+            current = f'{current} {sentence}' if current else sentence
+    if current:
+        batches.append(current)
+    return batches
+
+
 @dataclass
 class TTSMetrics:
     """Container for TTS synthesis metrics"""
@@ -85,6 +335,51 @@ class TTSMetrics:
     chars_per_second: Optional[float] = None
     realtime_factor: Optional[float] = None
     
+    # Served from the synthesized-audio cache; timings are the cache lookup, not the provider
+    cached: bool = False
+    
+    # Chunk arrivals in integer nanoseconds, packed as int64 and converted into chunk_timings (ms) in one pass
+    _chunk_ns: array = field(default_factory=lambda: array('q'), init=False, repr=False)
+    _chunk_bytes: int = field(default=0, init=False, repr=False)
+    
+    # Running chunk delay statistics in ns (Welford), updated by record_chunk()
+    _last_chunk_at: Optional[int] = field(default=None, init=False, repr=False)
+    _delay_count: int = field(default=0, init=False, repr=False)
+    _delay_mean: float = field(default=0.0, init=False, repr=False)
+    _delay_m2: float = field(default=0.0, init=False, repr=False)
+    _delay_min: float = field(default=0.0, init=False, repr=False)
+    _delay_max: float = field(default=0.0, init=False, repr=False)
+    
+    def record_chunk(self, elapsed_ns: int, size: int = 0):
+        """Record a chunk arrival (ns since request start, size in bytes) and fold its delay into the jitter stats"""
+        self._chunk_ns.append(elapsed_ns)
+        self._chunk_bytes += size
+        last = self._last_chunk_at
+        self._last_chunk_at = elapsed_ns
+        if last is None:
+            return
+        
+        delay = elapsed_ns - last
+        n = self._delay_count = self._delay_count + 1
+        if n == 1:
+            self._delay_min = self._delay_max = delay
+        elif delay < self._delay_min:
+            self._delay_min = delay
+        elif delay > self._delay_max:
+            self._delay_max = delay
+        diff = delay - self._delay_mean
+        self._delay_mean += diff / n
+        self._delay_m2 += diff * (delay - self._delay_mean)
+    
+    def clear_chunks(self):
+        """Forget recorded chunk arrivals, e.g. before retrying a stream"""
+        self.chunk_timings = []
+        self._chunk_ns = array('q')
+        self._chunk_bytes = 0
+        self._last_chunk_at = None
+        self._delay_count = 0
+        self._delay_mean = self._delay_m2 = 0.0
+    
     def calculate_derived_metrics(self):
         """Calculate derived metrics from raw measurements"""
         if self.total_synthesis_time and self.total_synthesis_time > 0:
@@ -93,18 +388,33 @@ class TTSMetrics:
             if self.audio_duration:
                 self.realtime_factor = self.audio_duration / (self.total_synthesis_time / 1000)
         
-        # Calculate jitter from chunk timings
-        if self.chunk_timings and len(self.chunk_timings) > 1:
-            delays = []
-            for i in range(1, len(self.chunk_timings)):
-                delay = self.chunk_timings[i] - self.chunk_timings[i-1]
-                delays.append(delay)
-            
-            if delays:
-                self.min_chunk_delay = min(delays)
-                self.max_chunk_delay = max(delays)
-                self.avg_chunk_delay = statistics.mean(delays)
-                self.playback_jitter = statistics.stdev(delays) if len(delays) > 1 else 0.0
+        if self._chunk_ns:
+            self.chunk_timings = (np.frombuffer(self._chunk_ns, dtype=np.int64) / NS_PER_MS).tolist()
+            # Chunk count and mean size come from the running totals unless set explicitly
+            if self.chunk_count is None:
+                self.chunk_count = len(self._chunk_ns)
+                self.avg_chunk_size = self._chunk_bytes / self.chunk_count
+        
+        # Jitter from the chunk delays accumulated by record_chunk()
+        n = self._delay_count
+        if n:
+            self.min_chunk_delay = self._delay_min / NS_PER_MS
+            self.max_chunk_delay = self._delay_max / NS_PER_MS
+            self.avg_chunk_delay = self._delay_mean / NS_PER_MS
+            self.playback_jitter = math.sqrt(self._delay_m2 / (n - 1)) / NS_PER_MS if n > 1 else 0.0
+    
+    def as_dict(self, exclude=()) -> Dict[str, Any]:
+        """
+        Public metrics by name, in field order, for responses and TTSEvaluation kwargs.
+        
+        Unlike dataclasses.asdict() this is a shallow read that skips the private
+        chunk buffers instead of deep-copying them.
+        """
+        return {name: getattr(self, name) for name in METRIC_FIELDS if name not in exclude}
+
+
+# Public TTSMetrics field names (the underscored ones are recording state, not metrics)
+METRIC_FIELDS = tuple(f.name for f in fields(TTSMetrics) if not f.name.startswith('_'))
 
 
 @dataclass
@@ -112,13 +422,22 @@ class TTSResult:
     """Result of a TTS synthesis operation"""
     success: bool
     audio_data: Optional[bytes] = None
-    audio_base64: Optional[str] = None
+    # Base64 the provider already returned (Google's audioContent); otherwise encoded on demand
+    encoded_audio: Optional[str] = field(default=None, repr=False)
     metrics: TTSMetrics = field(default_factory=TTSMetrics)
     error_message: str = ''
     provider_id: str = ''
     voice_id: str = ''
     model_id: str = ''
-    response_headers: Dict[str, str] = field(default_factory=dict)
+    # The response's own case-insensitive header mapping, not a copy; dict() it to persist
+    response_headers: Mapping[str, str] = field(default_factory=dict)
+    
+    @property
+    def audio_base64(self) -> str:
+        """Base64 of audio_data ('' when there is none), encoded on first access and then kept"""
+        if self.encoded_audio is None:
+            self.encoded_audio = binascii.b2a_base64(self.audio_data, newline=False).decode('ascii') if self.audio_data else ''
+        return self.encoded_audio
 
 
 class BaseTTSProvider(ABC):
@@ -127,9 +446,81 @@ class BaseTTSProvider(ABC):
     provider_id: str = ''
     provider_name: str = ''
     
+    # URL requested by prewarm() to open a pooled connection to the provider's API host
+    warmup_url: Optional[str] = None
+    
+    # Keep-alive pool sizes for the provider's HTTP session
+    POOL_CONNECTIONS = 16
+    POOL_MAXSIZE = 64
+    
+    # Read sizes (bytes) for streamed audio: a small first read for TTFA, then larger blocks
+    FIRST_CHUNK_SIZE = 1024
+    STREAM_CHUNK_SIZE = 8192
+    
+    # Requests in flight at once when synthesize_long() splits a text
+    LONG_TEXT_CONCURRENCY = 4
+    
     def __init__(self):
         self.api_key = None
         self.demo_mode = False
+        self.session = self._create_session()
+        self._voices = None
+        self._voices_expire_at = 0.0
+        # voice_id -> name index of the voice list it was built from
+        self._voice_names = {}
+        self._voice_names_for = None
+    
+    def _create_session(self) -> requests.Session:
+        """
+        HTTP session reused for every call to this provider's API.
+        
+        Providers are cached by TTSServiceManager, so connections stay open between
+        syntheses and later requests skip the TCP/TLS handshake. No retries are
+        mounted: a retried request would be reported as one slow synthesis.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.POOL_CONNECTIONS, pool_maxsize=self.POOL_MAXSIZE)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    def iter_audio(self, response: requests.Response):
+        """
+        Yield a streamed response body for timing chunk arrival.
+        
+        The first FIRST_CHUNK_SIZE bytes are yielded on their own so time-to-first-audio
+        is measured as before; the rest is read in STREAM_CHUNK_SIZE blocks straight
+        from urllib3, cutting per-chunk Python work (and timer calls) about eightfold.
+        
+        A fully read body hands its connection back to the session pool on its own;
+        the response is closed when the loop ends early too, so a failed stream
+        drops its half-read socket instead of holding a pool slot until GC.
+        """
+        raw = response.raw
+        try:
+            first = raw.read(self.FIRST_CHUNK_SIZE, decode_content=True)
+            if first:
+                yield first
+            yield from raw.stream(self.STREAM_CHUNK_SIZE, decode_content=True)
+        finally:
+            response.close()
+    
+    def prewarm(self):
+        """
+        Open a connection to the provider's API host in the background.
+        
+        The DNS lookup, TCP connect and TLS handshake are paid by a throwaway HEAD
+        request, leaving a live socket in the session pool for the first synthesis.
+        """
+        if self.demo_mode or not self.warmup_url:
+            return
+        threading.Thread(target=self._warm_connection, daemon=True).start()
+    
+    def _warm_connection(self):
+        try:
+            self.session.head(self.warmup_url, timeout=5)
+        except requests.RequestException:
+            pass
     
     @abstractmethod
     def synthesize(self, text: str, voice_id: str, **kwargs) -> TTSResult:
@@ -141,46 +532,178 @@ class BaseTTSProvider(ABC):
         """Synthesize text to speech with streaming"""
         pass
     
-    @abstractmethod
+    async def synthesize_async(self, text: str, voice_id: str, streaming: bool = False, **kwargs) -> TTSResult:
+        """
+        Awaitable synthesis for fanning out to several providers from one event loop.
+        
+        The blocking call runs on a worker thread (not the shared thread-sensitive one),
+        so concurrent awaits overlap their network waits.
+        """
+        method = self.synthesize_streaming if streaming else self.synthesize
+        return await sync_to_async(method, thread_sensitive=False)(text, voice_id, **kwargs)
+    
+    def synthesize_long(self, text: str, voice_id: str, streaming: bool = False,
+                        max_chars: int = LONG_TEXT_BATCH_CHARS, **kwargs) -> TTSResult:
+        """
+        Synthesize long text as sentence batches sent concurrently, joined in order.
+        
+        The first batch's audio is ready after one short synthesis rather than the
+        whole text, so time-to-first-audio is taken from that batch. Sizes and
+        durations are summed and total time is the wall time of the whole call.
+        """
+        batches = split_text_batches(text, max_chars)
+        if len(batches) < 2:
+            method = self.synthesize_streaming if streaming else self.synthesize
+            return method(text, voice_id, **kwargs)
+        
+        start_ns = time.perf_counter_ns()
+        results, offsets = async_to_sync(self._synthesize_batches)(batches, voice_id, streaming, start_ns, **kwargs)
+        end_ns = time.perf_counter_ns()
+        
+        failed = next((r for r in results if not r.success), None)
+        if failed:
+            return failed
+        
+        first = results[0]
+        metrics = TTSMetrics()
+        metrics.is_streaming = streaming
+        metrics.character_count, metrics.word_count = self.get_text_metrics(text)
+        metrics.time_to_first_byte = first.metrics.time_to_first_byte
+        metrics.time_to_first_audio = first.metrics.time_to_first_audio
+        metrics.total_synthesis_time = (end_ns - start_ns) / NS_PER_MS
+        metrics.audio_format = first.metrics.audio_format
+        metrics.sample_rate = first.metrics.sample_rate
+        metrics.bitrate = first.metrics.bitrate
+        
+        if first.audio_data[:4] == b'RIFF':
+            # One header for the joined PCM; each batch's own 44-byte header is dropped
+            sample_rate = struct.unpack_from('<I', first.audio_data, 24)[0]
+            audio_data = bytearray(pcm_wav_header(sample_rate))
+            for r in results:
+                audio_data += memoryview(r.audio_data)[44:]
+            set_wav_sizes(audio_data)
+        else:
+            audio_data = b''.join(r.audio_data for r in results)
+        metrics.audio_size = len(audio_data)
+        
+        durations = [r.metrics.audio_duration for r in results]
+        metrics.audio_duration = sum(durations) if None not in durations else None
+        
+        if streaming:
+            # Batch timings are relative to that batch's own start, so shift them by
+            # when it started. A chunk can only be played once it has arrived and
+            # everything before it has, so it is timed no earlier than the one before
+            last = 0
+            for r, offset_ns in zip(results, offsets):
+                for t in r.metrics.chunk_timings:
+                    last = max(last, offset_ns + round(t * NS_PER_MS))
+                    metrics.record_chunk(last)
+            metrics.chunk_count = sum(r.metrics.chunk_count or 0 for r in results)
+            metrics.avg_chunk_size = metrics.audio_size / metrics.chunk_count if metrics.chunk_count else 0
+        
+        metrics.calculate_derived_metrics()
+        
+        return TTSResult(
+            success=True,
+            audio_data=audio_data,
+            metrics=metrics,
+            provider_id=self.provider_id,
+            voice_id=voice_id,
+            model_id=first.model_id,
+        )
+    
+    async def _synthesize_batches(self, batches: List[str], voice_id: str, streaming: bool,
+                                  start_ns: int, **kwargs) -> Tuple[List[TTSResult], List[int]]:
+        """
+        Synthesize text batches with at most LONG_TEXT_CONCURRENCY requests in flight.
+        
+        Also returns when each batch started (ns after start_ns); batches beyond the
+        first LONG_TEXT_CONCURRENCY wait for a slot, so they start later.
+        """
+        semaphore = asyncio.Semaphore(self.LONG_TEXT_CONCURRENCY)
+        offsets = [0] * len(batches)
+        
+        async def run(index, batch):
+            async with semaphore:
+                offsets[index] = time.perf_counter_ns() - start_ns
+                return await self.synthesize_async(batch, voice_id, streaming, **kwargs)
+        
+        results = await asyncio.gather(*(run(index, batch) for index, batch in enumerate(batches)))
+        return results, offsets
+    
+    @property
+    def voices_cache_key(self) -> str:
+        """Cache key for the voice list; providers with a region list different voices per region"""
+        region = getattr(self, 'region', None)
+        return f'tts_voices:{self.provider_id}:{region}' if region else f'tts_voices:{self.provider_id}'
+    
     def get_voices(self) -> List[Dict[str, Any]]:
-        """Get available voices for this provider"""
+        """
+        Get available voices for this provider, cached for VOICES_CACHE_TIMEOUT seconds.
+        
+        The list is kept on the (process-wide) provider as well as in the shared
+        cache, so repeated lookups within the timeout skip the cache round trip too.
+        """
+        if self._voices is not None and time.monotonic() < self._voices_expire_at:
+            return self._voices
+        
+        voices = cache.get(self.voices_cache_key)
+        if voices is None:
+            voices = self.fetch_voices()
+            # An empty list means the API call failed; retry on the next request
+            if not voices:
+                return voices
+            cache.set(self.voices_cache_key, voices, settings.VOICES_CACHE_TIMEOUT)
+        self._voices = voices
+        self._voices_expire_at = time.monotonic() + settings.VOICES_CACHE_TIMEOUT
+        return voices
+    
+    def get_voice_name(self, voice_id: str) -> str:
+        """Display name of voice_id, or voice_id itself if the provider does not list it"""
+        voices = self.get_voices()
+        # Re-index only when get_voices() hands back a different (refreshed) list
+        if self._voice_names_for is not voices:
+            self._voice_names = {v['voice_id']: v.get('name', v['voice_id']) for v in voices}
+            self._voice_names_for = voices
+        return self._voice_names.get(voice_id, voice_id)
+    
+    @abstractmethod
+    def fetch_voices(self) -> List[Dict[str, Any]]:
+        """Fetch available voices for this provider from its API"""
         pass
     
     def get_text_metrics(self, text: str) -> Tuple[int, int]:
         """Get character and word count for text"""
-        char_count = len(text)
-        word_count = len(text.split())
-        return char_count, word_count
+        return text_metrics(text)
+    
+    # provider_ids whose DEMO MODE warning has already been logged by this process
+    _demo_banners_shown = set()
+    
+    def warn_demo_mode(self, reason: str, hint: str):
+        """
+        Log the DEMO MODE warning once per provider per process; each is a single
+        record, so warnings from providers created on parallel workers do not interleave.
+        """
+        if self.provider_id in BaseTTSProvider._demo_banners_shown:
+            return
+        BaseTTSProvider._demo_banners_shown.add(self.provider_id)
+        _log.warning('%s running in DEMO MODE - %s. %s', self.provider_name, reason, hint)
+    
+    # Header of the demo WAV (PCM, mono, 16-bit, 22050 Hz)
+    DEMO_SAMPLE_RATE = 22050
+    DEMO_WAV_HEADER = pcm_wav_header(DEMO_SAMPLE_RATE)
     
     def _generate_demo_audio(self, text: str) -> bytes:
-        """Generate placeholder audio data for demo mode"""
-        # Create a simple WAV header with silence
-        # This is a minimal valid WAV file
-        sample_rate = 22050
+        """Generate placeholder audio data for demo mode (a WAV of silence)"""
         duration = len(text) * 0.05  # ~50ms per character
-        num_samples = int(sample_rate * duration)
-        
-        # WAV header
-        wav_header = bytes([
-            0x52, 0x49, 0x46, 0x46,  # "RIFF"
-            0x24, 0x00, 0x00, 0x00,  # Chunk size (placeholder)
-            0x57, 0x41, 0x56, 0x45,  # "WAVE"
-            0x66, 0x6d, 0x74, 0x20,  # "fmt "
-            0x10, 0x00, 0x00, 0x00,  # Subchunk1 size (16)
-            0x01, 0x00,              # Audio format (PCM)
-            0x01, 0x00,              # Num channels (1)
-            0x22, 0x56, 0x00, 0x00,  # Sample rate (22050)
-            0x44, 0xac, 0x00, 0x00,  # Byte rate
-            0x02, 0x00,              # Block align
-            0x10, 0x00,              # Bits per sample (16)
-            0x64, 0x61, 0x74, 0x61,  # "data"
-            0x00, 0x00, 0x00, 0x00,  # Subchunk2 size (placeholder)
-        ])
-        
-        # Generate silence (zeros)
-        audio_data = bytes(num_samples * 2)  # 16-bit samples
-        
-        return wav_header + audio_data
+        data_size = int(self.DEMO_SAMPLE_RATE * duration) * 2  # 16-bit samples
+        
+        # One zero-filled buffer holds the silence; only the header bytes are written
+        audio = bytearray(len(self.DEMO_WAV_HEADER) + data_size)
+        audio[:len(self.DEMO_WAV_HEADER)] = self.DEMO_WAV_HEADER
+        set_wav_sizes(audio)
+        # Immutable, since the result may be kept in the synthesized-audio cache
+        return bytes(audio)
 
 
 class ElevenLabsProvider(BaseTTSProvider):
@@ -189,31 +712,37 @@ class ElevenLabsProvider(BaseTTSProvider):
     provider_id = 'elevenlabs'
     provider_name = 'ElevenLabs'
     
+    # ElevenLabs closes an input-streaming WebSocket after 20 s without messages,
+    # so idle connections are only reused within that window
+    WS_IDLE_TIMEOUT = 20
+    
     def __init__(self):
         super().__init__()
-        self.api_key = os.getenv('ELEVENLABS_API_KEY')
+        self.api_key = PROVIDER_ENV.elevenlabs_api_key
         self.demo_mode = not self.api_key
         self.base_url = 'https://api.elevenlabs.io/v1'
+        self.ws_base_url = 'wss://api.elevenlabs.io/v1'
+        self.warmup_url = self.base_url
+        if self.api_key:
+            self.session.headers['xi-api-key'] = self.api_key
+        self._ws_pool = {}
+        self._ws_lock = threading.Lock()
         
         if self.demo_mode:
-            print('-----------------------------------------------------')
-            print('ElevenLabs running in DEMO MODE - No API key found')
-            print('Define ELEVENLABS_API_KEY in ./backend/.env')
-            print('-----------------------------------------------------')
+            self.warn_demo_mode('No API key found', 'Define ELEVENLABS_API_KEY in ./backend/.env')
     
-    def get_voices(self) -> List[Dict[str, Any]]:
-        """Get available ElevenLabs voices"""
+    def fetch_voices(self) -> List[Dict[str, Any]]:
+        """Fetch available ElevenLabs voices"""
         if self.demo_mode:
             return settings.TTS_PROVIDERS.get('elevenlabs', {}).get('demo_voices', [])
         
         try:
-            response = requests.get(
+            response = self.session.get(
                 f'{self.base_url}/voices',
-                headers={'xi-api-key': self.api_key},
                 timeout=10
             )
             if response.status_code == 200:
-                data = response.json()
+                data = decode_json(response.content)
                 return [
                     {
                         'voice_id': v['voice_id'],
@@ -243,34 +772,33 @@ class ElevenLabsProvider(BaseTTSProvider):
         
         try:
             # Start time for TTFB
-            start_time = time.perf_counter() * 1000  # Convert to ms
+            start_ns = time.perf_counter_ns()
             
-            response = requests.post(
+            response = self.session.post(
                 f'{self.base_url}/text-to-speech/{voice_id}',
                 headers={
-                    'xi-api-key': self.api_key,
                     'Content-Type': 'application/json',
                     'Accept': 'audio/mpeg',
                 },
-                json={
+                data=encode_json({
                     'text': text,
                     'model_id': model_id,
                     'voice_settings': kwargs.get('voice_settings', {
                         'stability': 0.5,
                         'similarity_boost': 0.75,
                     }),
-                },
+                }),
                 timeout=60
             )
             
-            ttfb_time = time.perf_counter() * 1000
-            metrics.time_to_first_byte = ttfb_time - start_time
+            ttfb_ns = time.perf_counter_ns()
+            metrics.time_to_first_byte = (ttfb_ns - start_ns) / NS_PER_MS
             
             if response.status_code == 200:
                 audio_data = response.content
-                end_time = time.perf_counter() * 1000
+                end_ns = time.perf_counter_ns()
                 
-                metrics.total_synthesis_time = end_time - start_time
+                metrics.total_synthesis_time = (end_ns - start_ns) / NS_PER_MS
                 metrics.time_to_first_audio = metrics.time_to_first_byte
                 metrics.audio_size = len(audio_data)
                 metrics.audio_format = 'mp3'
@@ -283,12 +811,11 @@ class ElevenLabsProvider(BaseTTSProvider):
                 return TTSResult(
                     success=True,
                     audio_data=audio_data,
-                    audio_base64=base64.b64encode(audio_data).decode('utf-8'),
                     metrics=metrics,
                     provider_id=self.provider_id,
                     voice_id=voice_id,
                     model_id=model_id,
-                    response_headers=dict(response.headers),
+                    response_headers=response.headers,
                 )
             else:
                 return TTSResult(
@@ -323,72 +850,85 @@ class ElevenLabsProvider(BaseTTSProvider):
         if self.demo_mode:
             return self._demo_synthesis(text, voice_id, metrics, model_id)
         
+        if kwargs.get('websocket'):
+            return self.synthesize_ws(text, voice_id, metrics=metrics, **kwargs)
+        
+        # Raw PCM skips the MP3 encode server-side and the MP3 parse here; it is
+        # returned wrapped in a WAV header so the audio stays playable
+        output_format = kwargs.get('output_format', 'pcm_22050')
+        is_pcm = output_format.startswith('pcm_')
+        sample_rate = int(output_format.split('_')[1]) if is_pcm else None
+        
         try:
-            start_time = time.perf_counter() * 1000
-            chunks = []
-            chunk_sizes = []
+            start_ns = time.perf_counter_ns()
+            audio_buf = bytearray(pcm_wav_header(sample_rate)) if is_pcm else bytearray()
             first_chunk_received = False
             
-            response = requests.post(
+            response = self.session.post(
                 f'{self.base_url}/text-to-speech/{voice_id}/stream',
+                params={
+                    'output_format': output_format,
+                    'optimize_streaming_latency': kwargs.get('optimize_streaming_latency', 3),
+                },
                 headers={
-                    'xi-api-key': self.api_key,
                     'Content-Type': 'application/json',
-                    'Accept': 'audio/mpeg',
+                    'Accept': 'audio/pcm' if is_pcm else 'audio/mpeg',
                 },
-                json={
+                data=encode_json({
                     'text': text,
                     'model_id': model_id,
                     'voice_settings': kwargs.get('voice_settings', {
                         'stability': 0.5,
                         'similarity_boost': 0.75,
                     }),
-                },
+                }),
                 stream=True,
                 timeout=60
             )
             
             # TTFB: Time when HTTP headers are received (before reading body)
-            ttfb_time = time.perf_counter() * 1000
-            metrics.time_to_first_byte = ttfb_time - start_time
+            ttfb_ns = time.perf_counter_ns()
+            metrics.time_to_first_byte = (ttfb_ns - start_ns) / NS_PER_MS
             
             if response.status_code == 200:
-                for chunk in response.iter_content(chunk_size=1024):
+                for chunk in self.iter_audio(response):
                     if chunk:
-                        current_time = time.perf_counter() * 1000
+                        current_ns = time.perf_counter_ns()
                         
                         if not first_chunk_received:
                             # TTFA: Time when first audio data is received
-                            metrics.time_to_first_audio = current_time - start_time
+                            metrics.time_to_first_audio = (current_ns - start_ns) / NS_PER_MS
                             first_chunk_received = True
                         
-                        metrics.chunk_timings.append(current_time - start_time)
-                        chunks.append(chunk)
-                        chunk_sizes.append(len(chunk))
+                        metrics.record_chunk(current_ns - start_ns, len(chunk))
+                        audio_buf += chunk
                 
-                end_time = time.perf_counter() * 1000
-                audio_data = b''.join(chunks)
+                end_ns = time.perf_counter_ns()
+                audio_data = audio_buf
                 
-                metrics.total_synthesis_time = end_time - start_time
-                metrics.audio_size = len(audio_data)
-                metrics.audio_format = 'mp3'
-                metrics.chunk_count = len(chunks)
-                metrics.avg_chunk_size = statistics.mean(chunk_sizes) if chunk_sizes else 0
+                metrics.total_synthesis_time = (end_ns - start_ns) / NS_PER_MS
                 
                 # Calculate actual audio duration
-                metrics.audio_duration = get_audio_duration(audio_data, 'mp3')
+                if is_pcm:
+                    set_wav_sizes(audio_data)
+                    metrics.audio_format = 'wav'
+                    metrics.sample_rate = sample_rate
+                    metrics.audio_duration = get_audio_duration(audio_data, 'wav')
+                else:
+                    metrics.audio_format = 'mp3'
+                    metrics.audio_duration = get_audio_duration(audio_data, 'mp3')
+                metrics.audio_size = len(audio_data)
                 
                 metrics.calculate_derived_metrics()
                 
                 return TTSResult(
                     success=True,
                     audio_data=audio_data,
-                    audio_base64=base64.b64encode(audio_data).decode('utf-8'),
                     metrics=metrics,
                     provider_id=self.provider_id,
                     voice_id=voice_id,
                     model_id=model_id,
-                    response_headers=dict(response.headers),
+                    response_headers=response.headers,
                 )
             else:
                 return TTSResult(
@@ -410,10 +950,178 @@ class ElevenLabsProvider(BaseTTSProvider):
                 model_id=model_id,
             )
     
+    def synthesize_ws(self, text: str, voice_id: str, metrics: Optional[TTSMetrics] = None, **kwargs) -> TTSResult:
+        """
+        Synthesize text over ElevenLabs' multi-context input-streaming WebSocket.
+        
+        Connections are kept per voice and model, and each call runs in its own
+        context, so repeated phrases on the same voice skip the connection setup.
+        Audio arrives as base64 PCM frames and is returned as WAV, as in
+        synthesize_streaming().
+        """
+        if metrics is None:
+            metrics = TTSMetrics()
+            metrics.is_streaming = True
+            char_count, word_count = self.get_text_metrics(text)
+            metrics.character_count = char_count
+            metrics.word_count = word_count
+        
+        model_id = kwargs.get('model_id', 'eleven_multilingual_v2')
+        
+        if self.demo_mode:
+            return self._demo_synthesis(text, voice_id, metrics, model_id)
+        
+        try:
+            import websocket as ws_client
+        except ImportError:
+            print("websocket-client not installed, falling back to HTTP streaming")
+            return self.synthesize_streaming(text, voice_id, **dict(kwargs, websocket=False))
+        
+        output_format = kwargs.get('output_format', 'pcm_22050')
+        if not output_format.startswith('pcm_'):
+            return self.synthesize_streaming(text, voice_id, **dict(kwargs, websocket=False))
+        sample_rate = int(output_format.split('_')[1])
+        key = (voice_id, model_id, output_format)
+        
+        try:
+            start_ns = time.perf_counter_ns()
+            ws, reused = self._acquire_ws(ws_client, key)
+            try:
+                audio_buf = self._stream_context(ws, text, kwargs, metrics, start_ns, sample_rate)
+            except Exception:
+                ws.close()
+                if not reused:
+                    raise
+                # The idle connection was dropped by the service; retry once on a fresh one
+                ws, _ = self._acquire_ws(ws_client, key, fresh=True)
+                try:
+                    audio_buf = self._stream_context(ws, text, kwargs, metrics, start_ns, sample_rate)
+                except Exception:
+                    ws.close()
+                    raise
+            self._release_ws(key, ws)
+            end_ns = time.perf_counter_ns()
+            audio_data = audio_buf
+            
+            if len(audio_data) > 44:
+                set_wav_sizes(audio_data)
+                metrics.total_synthesis_time = (end_ns - start_ns) / NS_PER_MS
+                metrics.audio_size = len(audio_data)
+                metrics.audio_format = 'wav'
+                metrics.sample_rate = sample_rate
+                metrics.audio_duration = get_audio_duration(audio_data, 'wav')
+                
+                metrics.calculate_derived_metrics()
+                
+                return TTSResult(
+                    success=True,
+                    audio_data=audio_data,
+                    metrics=metrics,
+                    provider_id=self.provider_id,
+                    voice_id=voice_id,
+                    model_id=model_id,
+                )
+            else:
+                return TTSResult(
+                    success=False,
+                    metrics=metrics,
+                    error_message="No audio data received from WebSocket streaming",
+                    provider_id=self.provider_id,
+                    voice_id=voice_id,
+                    model_id=model_id,
+                )
+        
+        except Exception as e:
+            return TTSResult(
+                success=False,
+                metrics=metrics,
+                error_message=str(e),
+                provider_id=self.provider_id,
+                voice_id=voice_id,
+                model_id=model_id,
+            )
+    
+    def _acquire_ws(self, ws_client, key: Tuple[str, str, str], fresh: bool = False):
+        """Take an idle WebSocket for (voice_id, model_id, output_format) or open one; returns (connection, reused)"""
+        if not fresh:
+            now = time.monotonic()
+            with self._ws_lock:
+                idle = self._ws_pool.get(key, [])
+                while idle:
+                    ws, last_used = idle.pop()
+                    if ws.connected and now - last_used < self.WS_IDLE_TIMEOUT:
+                        return ws, True
+                    ws.close()
+        voice_id, model_id, output_format = key
+        ws = ws_client.create_connection(
+            f'{self.ws_base_url}/text-to-speech/{voice_id}/multi-stream-input'
+            f'?model_id={model_id}&output_format={output_format}',
+            header=[f'xi-api-key: {self.api_key}'],
+            timeout=30
+        )
+        return ws, False
+    
+    def _release_ws(self, key: Tuple[str, str, str], ws):
+        if not ws.connected:
+            return
+        with self._ws_lock:
+            self._ws_pool.setdefault(key, []).append((ws, time.monotonic()))
+    
+    def _stream_context(self, ws, text: str, options: Dict[str, Any], metrics: TTSMetrics,
+                        start_ns: int, sample_rate: int) -> bytearray:
+        """Send text in a new context on an open WebSocket and collect its audio frames"""
+        audio_buf = bytearray(pcm_wav_header(sample_rate))
+        first_chunk_received = False
+        metrics.time_to_first_byte = None
+        metrics.time_to_first_audio = None
+        metrics.clear_chunks()
+        
+        context_id = uuid.uuid4().hex
+        ws.send(json.dumps({
+            'text': text + ' ',
+            'context_id': context_id,
+            'voice_settings': options.get('voice_settings', {
+                'stability': 0.5,
+                'similarity_boost': 0.75,
+            }),
+        }))
+        ws.send(json.dumps({'context_id': context_id, 'flush': True}))
+        ws.send(json.dumps({'context_id': context_id, 'close_context': True}))
+        
+        while True:
+            message = ws.recv()
+            current_ns = time.perf_counter_ns()
+            
+            # TTFB: first message from the service for this context
+            if metrics.time_to_first_byte is None:
+                metrics.time_to_first_byte = (current_ns - start_ns) / NS_PER_MS
+            
+            if not message:
+                raise ConnectionError('ElevenLabs closed the WebSocket before the final message')
+            data = json.loads(message)
+            if data.get('contextId', data.get('context_id')) not in (None, context_id):
+                continue
+            if data.get('error'):
+                raise RuntimeError(data.get('message') or data['error'])
+            
+            audio = data.get('audio')
+            if audio:
+                audio_chunk = base64.b64decode(audio)
+                if not first_chunk_received:
+                    # TTFA: Time when first audio data is received
+                    metrics.time_to_first_audio = (current_ns - start_ns) / NS_PER_MS
+                    first_chunk_received = True
+                
+                metrics.record_chunk(current_ns - start_ns, len(audio_chunk))
+                audio_buf += audio_chunk
+            
+            if data.get('isFinal') or data.get('is_final'):
+                break
+        
+        return audio_buf
+    
     def _demo_synthesis(self, text: str, voice_id: str, metrics: TTSMetrics, model_id: str) -> TTSResult:
         """Generate demo response with simulated metrics"""
-        import random
-        
         # Simulate realistic latency
         time.sleep(0.1 + random.random() * 0.2)
         
@@ -432,7 +1140,6 @@ class ElevenLabsProvider(BaseTTSProvider):
         return TTSResult(
             success=True,
             audio_data=audio_data,
-            audio_base64=base64.b64encode(audio_data).decode('utf-8'),
             metrics=metrics,
             provider_id=self.provider_id,
             voice_id=voice_id,
@@ -447,24 +1154,28 @@ class GoogleTTSProvider(BaseTTSProvider):
     provider_id = 'google'
     provider_name = 'Google Cloud TTS'
     
+    # gRPC streaming synthesis returns 16-bit mono LINEAR16 at this rate
+    GRPC_SAMPLE_RATE = 24000
+    
     def __init__(self):
         super().__init__()
-        self.api_key = os.getenv('GOOGLE_TTS_API_KEY')
-        self.credentials_path = os.getenv('GOOGLE_APPLICATION_CREDENTIALS')
+        self.api_key = PROVIDER_ENV.google_api_key
+        self.credentials_path = PROVIDER_ENV.google_credentials_path
         # Only consider credentials valid if the file actually exists
         if self.credentials_path and not os.path.isfile(self.credentials_path):
-            print(f'Google credentials file not found at {self.credentials_path} - ignoring')
+            _log.warning('Google credentials file not found at %s - ignoring', self.credentials_path)
             self.credentials_path = None
         self.demo_mode = not (self.api_key or self.credentials_path)
         self.base_url = 'https://texttospeech.googleapis.com/v1'
+        self.warmup_url = self.base_url
+        # Google APIs only gzip responses for clients whose User-Agent contains "gzip";
+        # the base64 audioContent JSON is large and compresses well
+        self.session.headers['User-Agent'] = f'{requests.utils.default_user_agent()} (gzip)'
         self.grpc_client = None
         self.grpc_available = False
         
         if self.demo_mode:
-            print('-----------------------------------------------------')
-            print('Google TTS running in DEMO MODE - No credentials found')
-            print('Define GOOGLE_TTS_API_KEY or GOOGLE_APPLICATION_CREDENTIALS in ./backend/.env')
-            print('-----------------------------------------------------')
+            self.warn_demo_mode('No credentials found', 'Define GOOGLE_TTS_API_KEY or GOOGLE_APPLICATION_CREDENTIALS in ./backend/.env')
         else:
             # Try to import Google Cloud TTS client for streaming
             try:
@@ -474,26 +1185,26 @@ class GoogleTTSProvider(BaseTTSProvider):
                 if self.credentials_path:
                     self.grpc_client = texttospeech.TextToSpeechClient()
                     self.grpc_available = True
-                    print('Google Cloud TTS gRPC client loaded - streaming enabled')
+                    _log.info('Google Cloud TTS gRPC client loaded - streaming enabled')
                 else:
-                    print('Google TTS using API key - REST API only (gRPC requires service account)')
+                    _log.info('Google TTS using API key - REST API only (gRPC requires service account)')
             except ImportError:
-                print('Google Cloud TTS library not available - using REST API')
+                _log.info('Google Cloud TTS library not available - using REST API')
                 self.grpc_available = False
     
-    def get_voices(self) -> List[Dict[str, Any]]:
-        """Get available Google TTS voices"""
+    def fetch_voices(self) -> List[Dict[str, Any]]:
+        """Fetch available Google TTS voices"""
         if self.demo_mode:
             return settings.TTS_PROVIDERS.get('google', {}).get('demo_voices', [])
         
         try:
-            response = requests.get(
+            response = self.session.get(
                 f'{self.base_url}/voices',
                 params={'key': self.api_key},
                 timeout=10
             )
             if response.status_code == 200:
-                data = response.json()
+                data = decode_json(response.content)
                 return [
                     {
                         'voice_id': v['name'],
@@ -537,12 +1248,13 @@ class GoogleTTSProvider(BaseTTSProvider):
             return self._demo_synthesis(text, voice_id, metrics)
         
         try:
-            start_time = time.perf_counter() * 1000
+            start_ns = time.perf_counter_ns()
             
-            response = requests.post(
+            response = self.session.post(
                 f'{self.base_url}/text:synthesize',
                 params={'key': self.api_key},
-                json={
+                headers={'Content-Type': 'application/json'},
+                data=encode_json({
                     'input': {'text': text},
                     'voice': {
                         'languageCode': language_code,
@@ -553,21 +1265,21 @@ class GoogleTTSProvider(BaseTTSProvider):
                         'speakingRate': kwargs.get('speaking_rate', 1.0),
                         'pitch': kwargs.get('pitch', 0.0),
                     },
-                },
+                }),
                 timeout=60
             )
             
-            ttfb_time = time.perf_counter() * 1000
-            metrics.time_to_first_byte = ttfb_time - start_time
+            ttfb_ns = time.perf_counter_ns()
+            metrics.time_to_first_byte = (ttfb_ns - start_ns) / NS_PER_MS
             
             if response.status_code == 200:
-                data = response.json()
+                data = decode_json(response.content)
                 audio_content = data.get('audioContent', '')
                 audio_data = base64.b64decode(audio_content)
                 
-                end_time = time.perf_counter() * 1000
+                end_ns = time.perf_counter_ns()
                 
-                metrics.total_synthesis_time = end_time - start_time
+                metrics.total_synthesis_time = (end_ns - start_ns) / NS_PER_MS
                 metrics.time_to_first_audio = metrics.time_to_first_byte
                 metrics.audio_size = len(audio_data)
                 metrics.audio_format = 'mp3'
@@ -580,11 +1292,11 @@ class GoogleTTSProvider(BaseTTSProvider):
                 return TTSResult(
                     success=True,
                     audio_data=audio_data,
-                    audio_base64=audio_content,
+                    encoded_audio=audio_content,
                     metrics=metrics,
                     provider_id=self.provider_id,
                     voice_id=voice_id,
-                    response_headers=dict(response.headers),
+                    response_headers=response.headers,
                 )
             else:
                 return TTSResult(
@@ -630,9 +1342,9 @@ class GoogleTTSProvider(BaseTTSProvider):
     
     def _synthesize_grpc_streaming(self, text: str, voice_id: str, language_code: str, full_voice_name: str, metrics: TTSMetrics) -> TTSResult:
         """Use gRPC streaming API (requires service account credentials)"""
-        start_time = time.perf_counter() * 1000
-        chunks = []
-        chunk_sizes = []
+        start_ns = time.perf_counter_ns()
+        # LINEAR16 chunks are appended behind a WAV header so the buffer is a playable file as-is
+        audio_buf = bytearray(pcm_wav_header(self.GRPC_SAMPLE_RATE))
         first_chunk_received = False
         
         # Build the streaming synthesis request (gRPC streaming supports PCM/LINEAR16, not MP3)
@@ -657,68 +1369,60 @@ class GoogleTTSProvider(BaseTTSProvider):
         
         # TTFB: measured when gRPC call returns the response iterator
         responses = self.grpc_client.streaming_synthesize(request_generator())
-        ttfb_time = time.perf_counter() * 1000
-        metrics.time_to_first_byte = ttfb_time - start_time
+        ttfb_ns = time.perf_counter_ns()
+        metrics.time_to_first_byte = (ttfb_ns - start_ns) / NS_PER_MS
         
         for response in responses:
             if response.audio_content:
-                current_time = time.perf_counter() * 1000
+                current_ns = time.perf_counter_ns()
                 
                 if not first_chunk_received:
-                    metrics.time_to_first_audio = current_time - start_time
+                    metrics.time_to_first_audio = (current_ns - start_ns) / NS_PER_MS
                     first_chunk_received = True
                 
-                metrics.chunk_timings.append(current_time - start_time)
-                chunks.append(response.audio_content)
-                chunk_sizes.append(len(response.audio_content))
+                metrics.record_chunk(current_ns - start_ns, len(response.audio_content))
+                audio_buf += response.audio_content
         
-        end_time = time.perf_counter() * 1000
-        audio_data = b''.join(chunks)
+        end_ns = time.perf_counter_ns()
+        audio_data = audio_buf
         
-        if audio_data:
-            metrics.total_synthesis_time = end_time - start_time
-            metrics.chunk_count = len(chunks)
-            metrics.avg_chunk_size = statistics.mean(chunk_sizes) if chunk_sizes else 0
+        if len(audio_data) > 44:
+            set_wav_sizes(audio_data)
+            metrics.total_synthesis_time = (end_ns - start_ns) / NS_PER_MS
             
             # gRPC streaming returns PCM/LINEAR16 audio — convert to MP3 for playback
             try:
-                from pydub import AudioSegment
-                pcm_audio = AudioSegment(
-                    data=audio_data,
-                    sample_width=2,  # 16-bit LINEAR16
-                    frame_rate=24000,
-                    channels=1,
-                )
+                if AudioSegment is None:
+                    raise ImportError('pydub is not installed')
+                pcm_audio = AudioSegment.from_file(BytesIO(audio_data), format='wav')
                 mp3_buffer = BytesIO()
                 pcm_audio.export(mp3_buffer, format='mp3', bitrate='128k')
                 mp3_data = mp3_buffer.getvalue()
                 
                 metrics.audio_size = len(mp3_data)
                 metrics.audio_format = 'mp3'
-                metrics.sample_rate = 24000
+                metrics.sample_rate = self.GRPC_SAMPLE_RATE
                 metrics.audio_duration = len(pcm_audio) / 1000.0  # pydub gives ms
                 metrics.calculate_derived_metrics()
                 
                 return TTSResult(
                     success=True,
                     audio_data=mp3_data,
-                    audio_base64=base64.b64encode(mp3_data).decode('utf-8'),
                     metrics=metrics,
                     provider_id=self.provider_id,
                     voice_id=voice_id,
                 )
             except Exception as conv_err:
-                print(f"PCM to MP3 conversion failed: {conv_err}, returning raw PCM")
+                print(f"PCM to MP3 conversion failed: {conv_err}, returning WAV")
                 metrics.audio_size = len(audio_data)
                 metrics.audio_format = 'wav'
-                metrics.sample_rate = 24000
-                metrics.audio_duration = len(audio_data) / (24000 * 2)  # 16-bit mono
+                metrics.sample_rate = self.GRPC_SAMPLE_RATE
+                metrics.audio_duration = get_audio_duration(audio_data, 'wav')
                 metrics.calculate_derived_metrics()
                 
                 return TTSResult(
                     success=True,
                     audio_data=audio_data,
-                    audio_base64=base64.b64encode(audio_data).decode('utf-8'),
                     metrics=metrics,
                     provider_id=self.provider_id,
                     voice_id=voice_id,
@@ -735,16 +1439,16 @@ class GoogleTTSProvider(BaseTTSProvider):
     def _synthesize_rest_streaming(self, text: str, voice_id: str, language_code: str, full_voice_name: str, metrics: TTSMetrics, **kwargs) -> TTSResult:
         """Use REST API with streaming response to measure network jitter"""
         try:
-            start_time = time.perf_counter() * 1000
-            chunks = []
-            chunk_sizes = []
+            start_ns = time.perf_counter_ns()
+            audio_buf = bytearray()
             first_chunk_received = False
             
             # Use streaming request
-            response = requests.post(
+            response = self.session.post(
                 f'{self.base_url}/text:synthesize',
                 params={'key': self.api_key},
-                json={
+                headers={'Content-Type': 'application/json'},
+                data=encode_json({
                     'input': {'text': text},
                     'voice': {
                         'languageCode': language_code,
@@ -755,35 +1459,31 @@ class GoogleTTSProvider(BaseTTSProvider):
                         'speakingRate': kwargs.get('speaking_rate', 1.0),
                         'pitch': kwargs.get('pitch', 0.0),
                     },
-                },
+                }),
                 stream=True,  # Enable streaming
                 timeout=60
             )
             
-            ttfb_time = time.perf_counter() * 1000
-            metrics.time_to_first_byte = ttfb_time - start_time
+            ttfb_ns = time.perf_counter_ns()
+            metrics.time_to_first_byte = (ttfb_ns - start_ns) / NS_PER_MS
             
             if response.status_code == 200:
                 # Read response in chunks to measure timing
-                for chunk in response.iter_content(chunk_size=1024):
+                for chunk in self.iter_audio(response):
                     if chunk:
-                        current_time = time.perf_counter() * 1000
+                        current_ns = time.perf_counter_ns()
                         
                         if not first_chunk_received:
-                            metrics.time_to_first_audio = current_time - start_time
+                            metrics.time_to_first_audio = (current_ns - start_ns) / NS_PER_MS
                             first_chunk_received = True
                         
-                        metrics.chunk_timings.append(current_time - start_time)
-                        chunks.append(chunk)
-                        chunk_sizes.append(len(chunk))
+                        metrics.record_chunk(current_ns - start_ns, len(chunk))
+                        audio_buf += chunk
                 
-                end_time = time.perf_counter() * 1000
+                end_ns = time.perf_counter_ns()
                 
                 # Parse JSON response and extract audio
-                full_response = b''.join(chunks)
-                data = full_response.decode('utf-8')
-                import json as json_lib
-                json_data = json_lib.loads(data)
+                json_data = decode_json(audio_buf)
                 audio_content = json_data.get('audioContent', '')
                 audio_data = base64.b64decode(audio_content)
                 
@@ -791,23 +1491,21 @@ class GoogleTTSProvider(BaseTTSProvider):
                 # (The original chunks were JSON, not audio)
                 audio_chunk_count = max(1, len(audio_data) // 1024)
                 
-                metrics.total_synthesis_time = end_time - start_time
+                metrics.total_synthesis_time = (end_ns - start_ns) / NS_PER_MS
                 metrics.audio_size = len(audio_data)
                 metrics.audio_format = 'mp3'
                 metrics.sample_rate = 24000
-                metrics.chunk_count = len(chunks)
-                metrics.avg_chunk_size = statistics.mean(chunk_sizes) if chunk_sizes else 0
                 metrics.audio_duration = get_audio_duration(audio_data, 'mp3')
                 metrics.calculate_derived_metrics()
                 
                 return TTSResult(
                     success=True,
                     audio_data=audio_data,
-                    audio_base64=audio_content,
+                    encoded_audio=audio_content,
                     metrics=metrics,
                     provider_id=self.provider_id,
                     voice_id=voice_id,
-                    response_headers=dict(response.headers),
+                    response_headers=response.headers,
                 )
             else:
                 return TTSResult(
@@ -829,8 +1527,6 @@ class GoogleTTSProvider(BaseTTSProvider):
     
     def _demo_synthesis(self, text: str, voice_id: str, metrics: TTSMetrics) -> TTSResult:
         """Generate demo response with simulated streaming metrics"""
-        import random
-        
         time.sleep(0.1 + random.random() * 0.2)
         
         metrics.is_streaming = True
@@ -849,7 +1545,7 @@ class GoogleTTSProvider(BaseTTSProvider):
             # Add some variation to simulate real streaming jitter
             jitter_variation = random.uniform(-15, 15)
             timing = metrics.time_to_first_audio + (i * chunk_interval) + jitter_variation
-            metrics.chunk_timings.append(timing)
+            metrics.record_chunk(round(timing * NS_PER_MS))
         metrics.chunk_count = num_chunks
         metrics.avg_chunk_size = metrics.audio_size / num_chunks if num_chunks > 0 else 0
         
@@ -860,7 +1556,6 @@ class GoogleTTSProvider(BaseTTSProvider):
         return TTSResult(
             success=True,
             audio_data=audio_data,
-            audio_base64=base64.b64encode(audio_data).decode('utf-8'),
             metrics=metrics,
             provider_id=self.provider_id,
             voice_id=voice_id,
@@ -874,33 +1569,37 @@ class AzureTTSProvider(BaseTTSProvider):
     provider_id = 'azure'
     provider_name = 'Azure TTS'
     
+    # Idle synthesis WebSockets kept open between streaming calls
+    WS_POOL_SIZE = 4
+    
     def __init__(self):
         super().__init__()
-        self.api_key = os.getenv('AZURE_TTS_API_KEY')
-        self.region = os.getenv('AZURE_TTS_REGION', 'eastus')
+        self._ws_idle = []
+        self._ws_lock = threading.Lock()
+        self.api_key = PROVIDER_ENV.azure_api_key
+        self.region = PROVIDER_ENV.azure_region
         self.demo_mode = not self.api_key
         self.base_url = f'https://{self.region}.tts.speech.microsoft.com/cognitiveservices/v1'
         self.ws_url = f'wss://{self.region}.tts.speech.microsoft.com/cognitiveservices/websocket/v1'
+        self.warmup_url = f'https://{self.region}.tts.speech.microsoft.com'
+        if self.api_key:
+            self.session.headers['Ocp-Apim-Subscription-Key'] = self.api_key
         
         if self.demo_mode:
-            print('-----------------------------------------------------')
-            print('Azure TTS running in DEMO MODE - No API key found')
-            print('Define AZURE_TTS_API_KEY in ./backend/.env')
-            print('-----------------------------------------------------')
+            self.warn_demo_mode('No API key found', 'Define AZURE_TTS_API_KEY in ./backend/.env')
     
-    def get_voices(self) -> List[Dict[str, Any]]:
-        """Get available Azure TTS voices"""
+    def fetch_voices(self) -> List[Dict[str, Any]]:
+        """Fetch available Azure TTS voices"""
         if self.demo_mode:
             return settings.TTS_PROVIDERS.get('azure', {}).get('demo_voices', [])
         
         try:
-            response = requests.get(
+            response = self.session.get(
                 f'https://{self.region}.tts.speech.microsoft.com/cognitiveservices/voices/list',
-                headers={'Ocp-Apim-Subscription-Key': self.api_key},
                 timeout=10
             )
             if response.status_code == 200:
-                voices = response.json()
+                voices = decode_json(response.content)
                 return [
                     {
                         'voice_id': v['ShortName'],
@@ -927,16 +1626,15 @@ class AzureTTSProvider(BaseTTSProvider):
             return self._demo_synthesis(text, voice_id, metrics)
         
         try:
-            start_time = time.perf_counter() * 1000
+            start_ns = time.perf_counter_ns()
             
             ssml = f'''<speak version='1.0' xml:lang='en-US'>
                 <voice xml:lang='en-US' name='{voice_id}'>{text}</voice>
             </speak>'''
             
-            response = requests.post(
+            response = self.session.post(
                 self.base_url,
                 headers={
-                    'Ocp-Apim-Subscription-Key': self.api_key,
                     'Content-Type': 'application/ssml+xml',
                     'X-Microsoft-OutputFormat': 'audio-16khz-128kbitrate-mono-mp3',
                 },
@@ -944,14 +1642,14 @@ class AzureTTSProvider(BaseTTSProvider):
                 timeout=60
             )
             
-            ttfb_time = time.perf_counter() * 1000
-            metrics.time_to_first_byte = ttfb_time - start_time
+            ttfb_ns = time.perf_counter_ns()
+            metrics.time_to_first_byte = (ttfb_ns - start_ns) / NS_PER_MS
             
             if response.status_code == 200:
                 audio_data = response.content
-                end_time = time.perf_counter() * 1000
+                end_ns = time.perf_counter_ns()
                 
-                metrics.total_synthesis_time = end_time - start_time
+                metrics.total_synthesis_time = (end_ns - start_ns) / NS_PER_MS
                 metrics.time_to_first_audio = metrics.time_to_first_byte
                 metrics.audio_size = len(audio_data)
                 metrics.audio_format = 'mp3'
@@ -966,11 +1664,10 @@ class AzureTTSProvider(BaseTTSProvider):
                 return TTSResult(
                     success=True,
                     audio_data=audio_data,
-                    audio_base64=base64.b64encode(audio_data).decode('utf-8'),
                     metrics=metrics,
                     provider_id=self.provider_id,
                     voice_id=voice_id,
-                    response_headers=dict(response.headers),
+                    response_headers=response.headers,
                 )
             else:
                 return TTSResult(
@@ -1007,99 +1704,33 @@ class AzureTTSProvider(BaseTTSProvider):
             print("websocket-client not installed, falling back to REST streaming")
             return self._synthesize_rest_streaming(text, voice_id, metrics, **kwargs)
         
+        output_format = kwargs.get('output_format', 'audio-16khz-128kbitrate-mono-mp3')
         try:
-            start_time = time.perf_counter() * 1000
-            chunks = []
-            chunk_sizes = []
-            first_chunk_received = False
-            
-            request_id = uuid.uuid4().hex
-            timestamp = time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
-            
-            # Connect via WebSocket with subscription key auth
-            ws = ws_client.create_connection(
-                self.ws_url,
-                header=[
-                    f'Ocp-Apim-Subscription-Key: {self.api_key}',
-                    f'X-ConnectionId: {request_id}',
-                ],
-                timeout=30
-            )
-            
-            # TTFB: WebSocket connection established
-            ttfb_time = time.perf_counter() * 1000
-            metrics.time_to_first_byte = ttfb_time - start_time
-            
-            # Send speech.config message
-            output_format = kwargs.get('output_format', 'audio-16khz-128kbitrate-mono-mp3')
-            config_payload = (
-                f'Path: speech.config\r\n'
-                f'X-RequestId: {request_id}\r\n'
-                f'X-Timestamp: {timestamp}\r\n'
-                f'Content-Type: application/json\r\n\r\n'
-                f'{{"context":{{"synthesis":{{"audio":{{"metadataoptions":'
-                f'{{"sentenceBoundaryEnabled":false,"wordBoundaryEnabled":false}},'
-                f'"outputFormat":"{output_format}"}}}}}}}}'
-            )
-            ws.send(config_payload)
-            
-            # Send SSML message
-            ssml = f"<speak version='1.0' xml:lang='en-US'><voice name='{voice_id}'>{text}</voice></speak>"
-            ssml_payload = (
-                f'Path: ssml\r\n'
-                f'X-RequestId: {request_id}\r\n'
-                f'X-Timestamp: {timestamp}\r\n'
-                f'Content-Type: application/ssml+xml\r\n\r\n'
-                f'{ssml}'
-            )
-            ws.send(ssml_payload)
-            
-            # Receive audio chunks progressively
-            turn_ended = False
-            while not turn_ended:
+            start_ns = time.perf_counter_ns()
+            ws, reused = self._acquire_ws(ws_client)
+            try:
+                audio_buf = self._stream_turn(ws, ws_client, text, voice_id, output_format, metrics, start_ns)
+            except Exception:
+                ws.close()
+                if not reused:
+                    raise
+                # The idle connection was dropped by the service; retry once on a fresh one
+                ws, _ = self._acquire_ws(ws_client, fresh=True)
                 try:
-                    opcode, data = ws.recv_data()
-                except Exception as e:
-                    print(f"Azure WebSocket recv error: {e}")
-                    break
-                
-                if opcode == ws_client.ABNF.OPCODE_TEXT:
-                    # Text message - check for turn.end
-                    text_msg = data.decode('utf-8') if isinstance(data, bytes) else data
-                    if 'turn.end' in text_msg:
-                        turn_ended = True
-                    elif 'turn.start' in text_msg:
-                        pass  # Synthesis started
-                
-                elif opcode == ws_client.ABNF.OPCODE_BINARY:
-                    # Binary message - parse header and extract audio
-                    if len(data) > 2:
-                        header_len = struct.unpack('>H', data[:2])[0]
-                        audio_chunk = data[2 + header_len:]
-                        
-                        if audio_chunk:
-                            current_time = time.perf_counter() * 1000
-                            
-                            if not first_chunk_received:
-                                metrics.time_to_first_audio = current_time - start_time
-                                first_chunk_received = True
-                            
-                            metrics.chunk_timings.append(current_time - start_time)
-                            chunks.append(audio_chunk)
-                            chunk_sizes.append(len(audio_chunk))
-            
-            ws.close()
-            end_time = time.perf_counter() * 1000
-            audio_data = b''.join(chunks)
+                    audio_buf = self._stream_turn(ws, ws_client, text, voice_id, output_format, metrics, start_ns)
+                except Exception:
+                    ws.close()
+                    raise
+            self._release_ws(ws)
+            end_ns = time.perf_counter_ns()
+            audio_data = audio_buf
             
             if audio_data:
-                metrics.total_synthesis_time = end_time - start_time
+                metrics.total_synthesis_time = (end_ns - start_ns) / NS_PER_MS
                 metrics.audio_size = len(audio_data)
                 metrics.audio_format = 'mp3'
                 metrics.sample_rate = 16000
                 metrics.bitrate = 128
-                metrics.chunk_count = len(chunks)
-                metrics.avg_chunk_size = statistics.mean(chunk_sizes) if chunk_sizes else 0
                 
                 # Calculate actual audio duration
                 metrics.audio_duration = get_audio_duration(audio_data, 'mp3')
@@ -1109,7 +1740,6 @@ class AzureTTSProvider(BaseTTSProvider):
                 return TTSResult(
                     success=True,
                     audio_data=audio_data,
-                    audio_base64=base64.b64encode(audio_data).decode('utf-8'),
                     metrics=metrics,
                     provider_id=self.provider_id,
                     voice_id=voice_id,
@@ -1126,24 +1756,127 @@ class AzureTTSProvider(BaseTTSProvider):
         except Exception as e:
             # Fall back to REST streaming if WebSocket fails
             print(f"Azure WebSocket streaming failed: {e}, falling back to REST streaming")
+            metrics.time_to_first_byte = None
+            metrics.time_to_first_audio = None
+            metrics.clear_chunks()
             return self._synthesize_rest_streaming(text, voice_id, metrics, **kwargs)
     
+    def _acquire_ws(self, ws_client, fresh: bool = False):
+        """
+        Take an idle WebSocket from the pool, or open a new one.
+        
+        Returns (connection, reused). Each connection carries one synthesis turn at a
+        time; concurrent calls get their own connection and all of them are pooled
+        again afterwards, so later turns skip the TCP/TLS/upgrade handshake.
+        """
+        if not fresh:
+            with self._ws_lock:
+                while self._ws_idle:
+                    ws = self._ws_idle.pop()
+                    if ws.connected:
+                        return ws, True
+        ws = ws_client.create_connection(
+            self.ws_url,
+            header=[
+                f'Ocp-Apim-Subscription-Key: {self.api_key}',
+                f'X-ConnectionId: {uuid.uuid4().hex}',
+            ],
+            timeout=30
+        )
+        return ws, False
+    
+    def _release_ws(self, ws):
+        if not ws.connected:
+            return
+        with self._ws_lock:
+            if len(self._ws_idle) < self.WS_POOL_SIZE:
+                self._ws_idle.append(ws)
+                return
+        ws.close()
+    
+    def _stream_turn(self, ws, ws_client, text: str, voice_id: str, output_format: str,
+                     metrics: TTSMetrics, start_ns: int) -> bytearray:
+        """Run one speech.config/ssml turn on an open WebSocket and collect its audio"""
+        audio_buf = bytearray()
+        first_chunk_received = False
+        metrics.time_to_first_byte = None
+        metrics.time_to_first_audio = None
+        metrics.clear_chunks()
+        
+        request_id = uuid.uuid4().hex
+        timestamp = time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
+        
+        # Send speech.config message
+        config_payload = (
+            f'Path: speech.config\r\n'
+            f'X-RequestId: {request_id}\r\n'
+            f'X-Timestamp: {timestamp}\r\n'
+            f'Content-Type: application/json\r\n\r\n'
+            f'{{"context":{{"synthesis":{{"audio":{{"metadataoptions":'
+            f'{{"sentenceBoundaryEnabled":false,"wordBoundaryEnabled":false}},'
+            f'"outputFormat":"{output_format}"}}}}}}}}'
+        )
+        ws.send(config_payload)
+        
+        # Send SSML message
+        ssml = f"<speak version='1.0' xml:lang='en-US'><voice name='{voice_id}'>{text}</voice></speak>"
+        ssml_payload = (
+            f'Path: ssml\r\n'
+            f'X-RequestId: {request_id}\r\n'
+            f'X-Timestamp: {timestamp}\r\n'
+            f'Content-Type: application/ssml+xml\r\n\r\n'
+            f'{ssml}'
+        )
+        ws.send(ssml_payload)
+        
+        # Receive audio chunks progressively until turn.end
+        while True:
+            opcode, data = ws.recv_data()
+            current_ns = time.perf_counter_ns()
+            
+            # TTFB: first message from the service for this turn
+            if metrics.time_to_first_byte is None:
+                metrics.time_to_first_byte = (current_ns - start_ns) / NS_PER_MS
+            
+            if opcode == ws_client.ABNF.OPCODE_TEXT:
+                # Text message - check for turn.end
+                text_msg = data.decode('utf-8') if isinstance(data, bytes) else data
+                if 'turn.end' in text_msg:
+                    break
+            
+            elif opcode == ws_client.ABNF.OPCODE_BINARY:
+                # Binary message - parse header and extract audio
+                if len(data) > 2:
+                    header_len = struct.unpack('>H', data[:2])[0]
+                    audio_chunk = data[2 + header_len:]
+                    
+                    if audio_chunk:
+                        if not first_chunk_received:
+                            metrics.time_to_first_audio = (current_ns - start_ns) / NS_PER_MS
+                            first_chunk_received = True
+                        
+                        metrics.record_chunk(current_ns - start_ns, len(audio_chunk))
+                        audio_buf += audio_chunk
+            
+            elif opcode == ws_client.ABNF.OPCODE_CLOSE:
+                raise ConnectionError('Azure closed the WebSocket before turn.end')
+        
+        return audio_buf
+    
     def _synthesize_rest_streaming(self, text: str, voice_id: str, metrics: TTSMetrics, **kwargs) -> TTSResult:
         """Fallback: REST API with chunked response reading"""
         try:
-            start_time = time.perf_counter() * 1000
-            chunks = []
-            chunk_sizes = []
+            start_ns = time.perf_counter_ns()
+            audio_buf = bytearray()
             first_chunk_received = False
             
             ssml = f'''<speak version='1.0' xml:lang='en-US'>
                 <voice xml:lang='en-US' name='{voice_id}'>{text}</voice>
             </speak>'''
             
-            response = requests.post(
+            response = self.session.post(
                 self.base_url,
                 headers={
-                    'Ocp-Apim-Subscription-Key': self.api_key,
                     'Content-Type': 'application/ssml+xml',
                     'X-Microsoft-OutputFormat': 'audio-16khz-128kbitrate-mono-mp3',
                 },
@@ -1152,44 +1885,40 @@ class AzureTTSProvider(BaseTTSProvider):
                 timeout=60
             )
             
-            ttfb_time = time.perf_counter() * 1000
+            ttfb_ns = time.perf_counter_ns()
             if not metrics.time_to_first_byte:
-                metrics.time_to_first_byte = ttfb_time - start_time
+                metrics.time_to_first_byte = (ttfb_ns - start_ns) / NS_PER_MS
             
             if response.status_code == 200:
-                for chunk in response.iter_content(chunk_size=1024):
+                for chunk in self.iter_audio(response):
                     if chunk:
-                        current_time = time.perf_counter() * 1000
+                        current_ns = time.perf_counter_ns()
                         
                         if not first_chunk_received:
-                            metrics.time_to_first_audio = current_time - start_time
+                            metrics.time_to_first_audio = (current_ns - start_ns) / NS_PER_MS
                             first_chunk_received = True
                         
-                        metrics.chunk_timings.append(current_time - start_time)
-                        chunks.append(chunk)
-                        chunk_sizes.append(len(chunk))
+                        metrics.record_chunk(current_ns - start_ns, len(chunk))
+                        audio_buf += chunk
                 
-                end_time = time.perf_counter() * 1000
-                audio_data = b''.join(chunks)
+                end_ns = time.perf_counter_ns()
+                audio_data = audio_buf
                 
-                metrics.total_synthesis_time = end_time - start_time
+                metrics.total_synthesis_time = (end_ns - start_ns) / NS_PER_MS
                 metrics.audio_size = len(audio_data)
                 metrics.audio_format = 'mp3'
                 metrics.sample_rate = 16000
                 metrics.bitrate = 128
-                metrics.chunk_count = len(chunks)
-                metrics.avg_chunk_size = statistics.mean(chunk_sizes) if chunk_sizes else 0
                 metrics.audio_duration = get_audio_duration(audio_data, 'mp3')
                 metrics.calculate_derived_metrics()
                 
                 return TTSResult(
                     success=True,
                     audio_data=audio_data,
-                    audio_base64=base64.b64encode(audio_data).decode('utf-8'),
                     metrics=metrics,
                     provider_id=self.provider_id,
                     voice_id=voice_id,
-                    response_headers=dict(response.headers),
+                    response_headers=response.headers,
                 )
             else:
                 return TTSResult(
@@ -1211,8 +1940,6 @@ class AzureTTSProvider(BaseTTSProvider):
     
     def _demo_synthesis(self, text: str, voice_id: str, metrics: TTSMetrics) -> TTSResult:
         """Generate demo response with simulated streaming metrics"""
-        import random
-        
         time.sleep(0.1 + random.random() * 0.2)
         
         metrics.is_streaming = True
@@ -1232,7 +1959,7 @@ class AzureTTSProvider(BaseTTSProvider):
             # Add some variation to simulate real streaming jitter
             jitter_variation = random.uniform(-20, 20)
             timing = metrics.time_to_first_audio + (i * chunk_interval) + jitter_variation
-            metrics.chunk_timings.append(timing)
+            metrics.record_chunk(round(timing * NS_PER_MS))
         metrics.chunk_count = num_chunks
         metrics.avg_chunk_size = metrics.audio_size / num_chunks if num_chunks > 0 else 0
         
@@ -1243,7 +1970,6 @@ class AzureTTSProvider(BaseTTSProvider):
         return TTSResult(
             success=True,
             audio_data=audio_data,
-            audio_base64=base64.b64encode(audio_data).decode('utf-8'),
             metrics=metrics,
             provider_id=self.provider_id,
             voice_id=voice_id,
@@ -1259,33 +1985,35 @@ class AmazonPollyProvider(BaseTTSProvider):
     
     def __init__(self):
         super().__init__()
-        self.access_key = os.getenv('AWS_ACCESS_KEY_ID')
-        self.secret_key = os.getenv('AWS_SECRET_ACCESS_KEY')
-        self.region = os.getenv('AWS_REGION', 'us-east-1')
+        self.access_key = PROVIDER_ENV.aws_access_key
+        self.secret_key = PROVIDER_ENV.aws_secret_key
+        self.region = PROVIDER_ENV.aws_region
         self.demo_mode = not (self.access_key and self.secret_key)
+        self.warmup_url = f'https://polly.{self.region}.amazonaws.com'
         
         if self.demo_mode:
-            print('-----------------------------------------------------')
-            print('Amazon Polly running in DEMO MODE - No credentials found')
-            print('Define AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY in ./backend/.env')
-            print('-----------------------------------------------------')
+            self.warn_demo_mode('No credentials found', 'Define AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY in ./backend/.env')
+            self.client = None
+        elif boto3 is None:
+            _log.warning('boto3 not installed, Amazon Polly unavailable')
+            self.demo_mode = True
             self.client = None
         else:
-            try:
-                import boto3
-                self.client = boto3.client(
-                    'polly',
-                    aws_access_key_id=self.access_key,
-                    aws_secret_access_key=self.secret_key,
-                    region_name=self.region
-                )
-            except ImportError:
-                print('boto3 not installed, Amazon Polly unavailable')
-                self.demo_mode = True
-                self.client = None
+            # Same pool size and no-retry policy as the requests session
+            self.client = boto3.client(
+                'polly',
+                aws_access_key_id=self.access_key,
+                aws_secret_access_key=self.secret_key,
+                region_name=self.region,
+                config=BotoConfig(
+                    max_pool_connections=self.POOL_MAXSIZE,
+                    retries={'total_max_attempts': 1},
+                    tcp_keepalive=True,
+                ),
+            )
     
-    def get_voices(self) -> List[Dict[str, Any]]:
-        """Get available Amazon Polly voices that support the generative engine.
+    def fetch_voices(self) -> List[Dict[str, Any]]:
+        """Fetch available Amazon Polly voices that support the generative engine.
         
         Only voices with generative engine support are returned to ensure
         accurate streaming metrics (TTFB, TTFA, jitter).
@@ -1336,7 +2064,7 @@ class AmazonPollyProvider(BaseTTSProvider):
             return self._demo_synthesis(text, voice_id, metrics)
         
         try:
-            start_time = time.perf_counter() * 1000
+            start_ns = time.perf_counter_ns()
             
             response = self.client.synthesize_speech(
                 Text=text,
@@ -1345,14 +2073,14 @@ class AmazonPollyProvider(BaseTTSProvider):
                 Engine=engine
             )
             
-            ttfb_time = time.perf_counter() * 1000
-            metrics.time_to_first_byte = ttfb_time - start_time
+            ttfb_ns = time.perf_counter_ns()
+            metrics.time_to_first_byte = (ttfb_ns - start_ns) / NS_PER_MS
             
             if 'AudioStream' in response:
                 audio_data = response['AudioStream'].read()
-                end_time = time.perf_counter() * 1000
+                end_ns = time.perf_counter_ns()
                 
-                metrics.total_synthesis_time = end_time - start_time
+                metrics.total_synthesis_time = (end_ns - start_ns) / NS_PER_MS
                 metrics.time_to_first_audio = metrics.time_to_first_byte
                 metrics.audio_size = len(audio_data)
                 metrics.audio_format = 'mp3'
@@ -1365,7 +2093,6 @@ class AmazonPollyProvider(BaseTTSProvider):
                 return TTSResult(
                     success=True,
                     audio_data=audio_data,
-                    audio_base64=base64.b64encode(audio_data).decode('utf-8'),
                     metrics=metrics,
                     provider_id=self.provider_id,
                     voice_id=voice_id,
@@ -1394,7 +2121,7 @@ class AmazonPollyProvider(BaseTTSProvider):
         Uses the Polly REST API with requests stream=True and AWS SigV4 authentication,
         providing the same HTTP streaming pattern as ElevenLabs and OpenAI:
         - TTFB = HTTP response headers received
-        - TTFA = first audio byte from iter_content()
+        - TTFA = first audio bytes from iter_audio()
         - Jitter = variation in progressive audio chunk delivery
         """
         metrics = TTSMetrics()
@@ -1405,6 +2132,8 @@ class AmazonPollyProvider(BaseTTSProvider):
         
         # Always use generative engine for accurate streaming metrics
         engine = 'generative'
+        # include_audio=False keeps the timing metrics but discards the body as it arrives
+        include_audio = kwargs.get('include_audio', True)
         
         if self.demo_mode:
             return self._demo_synthesis(text, voice_id, metrics)
@@ -1415,12 +2144,12 @@ class AmazonPollyProvider(BaseTTSProvider):
             from botocore.credentials import Credentials
         except ImportError:
             print("botocore not available, falling back to boto3 SDK streaming")
-            return self._synthesize_sdk_streaming(text, voice_id, engine, metrics)
+            return self._synthesize_sdk_streaming(text, voice_id, engine, metrics, include_audio)
         
         try:
-            start_time = time.perf_counter() * 1000
-            chunks = []
-            chunk_sizes = []
+            start_ns = time.perf_counter_ns()
+            audio_buf = bytearray()
+            audio_size = 0
             first_chunk_received = False
             
             # Build REST API request to Polly SynthesizeSpeech endpoint
@@ -1443,7 +2172,7 @@ class AmazonPollyProvider(BaseTTSProvider):
             SigV4Auth(credentials, 'polly', self.region).add_auth(aws_request)
             
             # Make streaming HTTP request (identical to ElevenLabs/OpenAI pattern)
-            response = requests.post(
+            response = self.session.post(
                 url,
                 headers=dict(aws_request.headers),
                 data=payload,
@@ -1452,45 +2181,44 @@ class AmazonPollyProvider(BaseTTSProvider):
             )
             
             # TTFB: HTTP response headers received
-            ttfb_time = time.perf_counter() * 1000
-            metrics.time_to_first_byte = ttfb_time - start_time
+            ttfb_ns = time.perf_counter_ns()
+            metrics.time_to_first_byte = (ttfb_ns - start_ns) / NS_PER_MS
             
             if response.status_code == 200:
-                for chunk in response.iter_content(chunk_size=1024):
+                for chunk in self.iter_audio(response):
                     if chunk:
-                        current_time = time.perf_counter() * 1000
+                        current_ns = time.perf_counter_ns()
                         
                         if not first_chunk_received:
                             # TTFA: first audio byte from the stream
-                            metrics.time_to_first_audio = current_time - start_time
+                            metrics.time_to_first_audio = (current_ns - start_ns) / NS_PER_MS
                             first_chunk_received = True
                         
-                        metrics.chunk_timings.append(current_time - start_time)
-                        chunks.append(chunk)
-                        chunk_sizes.append(len(chunk))
+                        metrics.record_chunk(current_ns - start_ns, len(chunk))
+                        audio_size += len(chunk)
+                        if include_audio:
+                            audio_buf += chunk
                 
-                end_time = time.perf_counter() * 1000
-                audio_data = b''.join(chunks)
+                end_ns = time.perf_counter_ns()
+                audio_data = audio_buf if include_audio else b''
                 
-                metrics.total_synthesis_time = end_time - start_time
-                metrics.audio_size = len(audio_data)
+                metrics.total_synthesis_time = (end_ns - start_ns) / NS_PER_MS
+                metrics.audio_size = audio_size
                 metrics.audio_format = 'mp3'
-                metrics.chunk_count = len(chunks)
-                metrics.avg_chunk_size = statistics.mean(chunk_sizes) if chunk_sizes else 0
                 
-                # Calculate actual audio duration
-                metrics.audio_duration = get_audio_duration(audio_data, 'mp3')
+                # Calculate actual audio duration (only possible when the body was kept)
+                if include_audio:
+                    metrics.audio_duration = get_audio_duration(audio_data, 'mp3')
                 
                 metrics.calculate_derived_metrics()
                 
                 return TTSResult(
                     success=True,
                     audio_data=audio_data,
-                    audio_base64=base64.b64encode(audio_data).decode('utf-8'),
                     metrics=metrics,
                     provider_id=self.provider_id,
                     voice_id=voice_id,
-                    response_headers=dict(response.headers),
+                    response_headers=response.headers,
                 )
             else:
                 error_body = response.text
@@ -1504,14 +2232,28 @@ class AmazonPollyProvider(BaseTTSProvider):
         
         except Exception as e:
             print(f"Polly REST streaming failed: {e}, falling back to SDK streaming")
-            return self._synthesize_sdk_streaming(text, voice_id, engine, metrics)
+            return self._synthesize_sdk_streaming(text, voice_id, engine, metrics, include_audio)
+    
+    def iter_audio_stream(self, audio_stream):
+        """
+        Yield a botocore AudioStream the way iter_audio() yields an HTTP body: a
+        FIRST_CHUNK_SIZE read for time-to-first-audio, then STREAM_CHUNK_SIZE blocks.
+        """
+        try:
+            first = audio_stream.read(self.FIRST_CHUNK_SIZE)
+            if first:
+                yield first
+            yield from audio_stream.iter_chunks(self.STREAM_CHUNK_SIZE)
+        finally:
+            audio_stream.close()
     
-    def _synthesize_sdk_streaming(self, text: str, voice_id: str, engine: str, metrics: TTSMetrics) -> TTSResult:
-        """Fallback: boto3 SDK synthesize_speech with AudioStream.read() chunking"""
+    def _synthesize_sdk_streaming(self, text: str, voice_id: str, engine: str, metrics: TTSMetrics,
+                                  include_audio: bool = True) -> TTSResult:
+        """Fallback: boto3 SDK synthesize_speech with chunked AudioStream reads"""
         try:
-            start_time = time.perf_counter() * 1000
-            chunks = []
-            chunk_sizes = []
+            start_ns = time.perf_counter_ns()
+            audio_buf = bytearray()
+            audio_size = 0
             first_chunk_received = False
             
             response = self.client.synthesize_speech(
@@ -1521,42 +2263,35 @@ class AmazonPollyProvider(BaseTTSProvider):
                 Engine=engine
             )
             
-            ttfb_time = time.perf_counter() * 1000
-            metrics.time_to_first_byte = ttfb_time - start_time
+            ttfb_ns = time.perf_counter_ns()
+            metrics.time_to_first_byte = (ttfb_ns - start_ns) / NS_PER_MS
             
             if 'AudioStream' in response:
-                audio_stream = response['AudioStream']
-                
-                while True:
-                    chunk = audio_stream.read(1024)
-                    if not chunk:
-                        break
-                    
-                    current_time = time.perf_counter() * 1000
+                for chunk in self.iter_audio_stream(response['AudioStream']):
+                    current_ns = time.perf_counter_ns()
                     
                     if not first_chunk_received:
-                        metrics.time_to_first_audio = current_time - start_time
+                        metrics.time_to_first_audio = (current_ns - start_ns) / NS_PER_MS
                         first_chunk_received = True
                     
-                    metrics.chunk_timings.append(current_time - start_time)
-                    chunks.append(chunk)
-                    chunk_sizes.append(len(chunk))
+                    metrics.record_chunk(current_ns - start_ns, len(chunk))
+                    audio_size += len(chunk)
+                    if include_audio:
+                        audio_buf += chunk
                 
-                end_time = time.perf_counter() * 1000
-                audio_data = b''.join(chunks)
+                end_ns = time.perf_counter_ns()
+                audio_data = audio_buf if include_audio else b''
                 
-                metrics.total_synthesis_time = end_time - start_time
-                metrics.audio_size = len(audio_data)
+                metrics.total_synthesis_time = (end_ns - start_ns) / NS_PER_MS
+                metrics.audio_size = audio_size
                 metrics.audio_format = 'mp3'
-                metrics.chunk_count = len(chunks)
-                metrics.avg_chunk_size = statistics.mean(chunk_sizes) if chunk_sizes else 0
-                metrics.audio_duration = get_audio_duration(audio_data, 'mp3')
+                if include_audio:
+                    metrics.audio_duration = get_audio_duration(audio_data, 'mp3')
                 metrics.calculate_derived_metrics()
                 
                 return TTSResult(
                     success=True,
                     audio_data=audio_data,
-                    audio_base64=base64.b64encode(audio_data).decode('utf-8'),
                     metrics=metrics,
                     provider_id=self.provider_id,
                     voice_id=voice_id,
@@ -1578,11 +2313,9 @@ class AmazonPollyProvider(BaseTTSProvider):
                 provider_id=self.provider_id,
                 voice_id=voice_id,
             )
-
+    
     def _demo_synthesis(self, text: str, voice_id: str, metrics: TTSMetrics) -> TTSResult:
         """Generate demo response with simulated metrics"""
-        import random
-        
         time.sleep(0.1 + random.random() * 0.2)
         
         metrics.time_to_first_byte = 55 + random.random() * 75
@@ -1599,7 +2332,6 @@ class AmazonPollyProvider(BaseTTSProvider):
         return TTSResult(
             success=True,
             audio_data=audio_data,
-            audio_base64=base64.b64encode(audio_data).decode('utf-8'),
             metrics=metrics,
             provider_id=self.provider_id,
             voice_id=voice_id,
@@ -1615,18 +2347,18 @@ class OpenAITTSProvider(BaseTTSProvider):
     
     def __init__(self):
         super().__init__()
-        self.api_key = os.getenv('OPENAI_API_KEY')
+        self.api_key = PROVIDER_ENV.openai_api_key
         self.demo_mode = not self.api_key
         self.base_url = 'https://api.openai.com/v1/audio/speech'
+        self.warmup_url = 'https://api.openai.com'
+        if self.api_key:
+            self.session.headers['Authorization'] = f'Bearer {self.api_key}'
         
         if self.demo_mode:
-            print('-----------------------------------------------------')
-            print('OpenAI TTS running in DEMO MODE - No API key found')
-            print('Define OPENAI_API_KEY in ./backend/.env')
-            print('-----------------------------------------------------')
+            self.warn_demo_mode('No API key found', 'Define OPENAI_API_KEY in ./backend/.env')
     
-    def get_voices(self) -> List[Dict[str, Any]]:
-        """Get available OpenAI TTS voices"""
+    def fetch_voices(self) -> List[Dict[str, Any]]:
+        """Fetch available OpenAI TTS voices"""
         # OpenAI has a fixed set of voices
         return settings.TTS_PROVIDERS.get('openai', {}).get('demo_voices', [])
     
@@ -1643,31 +2375,30 @@ class OpenAITTSProvider(BaseTTSProvider):
             return self._demo_synthesis(text, voice_id, metrics, model)
         
         try:
-            start_time = time.perf_counter() * 1000
+            start_ns = time.perf_counter_ns()
             
-            response = requests.post(
+            response = self.session.post(
                 self.base_url,
                 headers={
-                    'Authorization': f'Bearer {self.api_key}',
                     'Content-Type': 'application/json',
                 },
-                json={
+                data=encode_json({
                     'model': model,
                     'input': text,
                     'voice': voice_id,
                     'response_format': 'mp3',
-                },
+                }),
                 timeout=60
             )
             
-            ttfb_time = time.perf_counter() * 1000
-            metrics.time_to_first_byte = ttfb_time - start_time
+            ttfb_ns = time.perf_counter_ns()
+            metrics.time_to_first_byte = (ttfb_ns - start_ns) / NS_PER_MS
             
             if response.status_code == 200:
                 audio_data = response.content
-                end_time = time.perf_counter() * 1000
+                end_ns = time.perf_counter_ns()
                 
-                metrics.total_synthesis_time = end_time - start_time
+                metrics.total_synthesis_time = (end_ns - start_ns) / NS_PER_MS
                 metrics.time_to_first_audio = metrics.time_to_first_byte
                 metrics.audio_size = len(audio_data)
                 metrics.audio_format = 'mp3'
@@ -1680,12 +2411,11 @@ class OpenAITTSProvider(BaseTTSProvider):
                 return TTSResult(
                     success=True,
                     audio_data=audio_data,
-                    audio_base64=base64.b64encode(audio_data).decode('utf-8'),
                     metrics=metrics,
                     provider_id=self.provider_id,
                     voice_id=voice_id,
                     model_id=model,
-                    response_headers=dict(response.headers),
+                    response_headers=response.headers,
                 )
             else:
                 return TTSResult(
@@ -1715,73 +2445,73 @@ class OpenAITTSProvider(BaseTTSProvider):
         metrics.word_count = word_count
         
         model = kwargs.get('model', 'tts-1')
+        # include_audio=False keeps the timing metrics but discards the body as it arrives
+        include_audio = kwargs.get('include_audio', True)
         
         if self.demo_mode:
             return self._demo_synthesis(text, voice_id, metrics, model)
         
         try:
-            start_time = time.perf_counter() * 1000
-            chunks = []
-            chunk_sizes = []
+            start_ns = time.perf_counter_ns()
+            audio_buf = bytearray()
+            audio_size = 0
             first_chunk_received = False
             
-            response = requests.post(
+            response = self.session.post(
                 self.base_url,
                 headers={
-                    'Authorization': f'Bearer {self.api_key}',
                     'Content-Type': 'application/json',
                 },
-                json={
+                data=encode_json({
                     'model': model,
                     'input': text,
                     'voice': voice_id,
                     'response_format': 'mp3',
-                },
+                }),
                 stream=True,
                 timeout=60
             )
             
             # TTFB is when we get the HTTP response (headers received)
-            ttfb_time = time.perf_counter() * 1000
-            metrics.time_to_first_byte = ttfb_time - start_time
+            ttfb_ns = time.perf_counter_ns()
+            metrics.time_to_first_byte = (ttfb_ns - start_ns) / NS_PER_MS
             
             if response.status_code == 200:
-                for chunk in response.iter_content(chunk_size=1024):
+                for chunk in self.iter_audio(response):
                     if chunk:
-                        current_time = time.perf_counter() * 1000
+                        current_ns = time.perf_counter_ns()
                         
                         if not first_chunk_received:
                             # TTFA is when we get the first audio chunk
-                            metrics.time_to_first_audio = current_time - start_time
+                            metrics.time_to_first_audio = (current_ns - start_ns) / NS_PER_MS
                             first_chunk_received = True
                         
-                        metrics.chunk_timings.append(current_time - start_time)
-                        chunks.append(chunk)
-                        chunk_sizes.append(len(chunk))
+                        metrics.record_chunk(current_ns - start_ns, len(chunk))
+                        audio_size += len(chunk)
+                        if include_audio:
+                            audio_buf += chunk
                 
-                end_time = time.perf_counter() * 1000
-                audio_data = b''.join(chunks)
+                end_ns = time.perf_counter_ns()
+                audio_data = audio_buf if include_audio else b''
                 
-                metrics.total_synthesis_time = end_time - start_time
-                metrics.audio_size = len(audio_data)
+                metrics.total_synthesis_time = (end_ns - start_ns) / NS_PER_MS
+                metrics.audio_size = audio_size
                 metrics.audio_format = 'mp3'
-                metrics.chunk_count = len(chunks)
-                metrics.avg_chunk_size = statistics.mean(chunk_sizes) if chunk_sizes else 0
                 
-                # Calculate actual audio duration
-                metrics.audio_duration = get_audio_duration(audio_data, 'mp3')
+                # Calculate actual audio duration (only possible when the body was kept)
+                if include_audio:
+                    metrics.audio_duration = get_audio_duration(audio_data, 'mp3')
                 
                 metrics.calculate_derived_metrics()
                 
                 return TTSResult(
                     success=True,
                     audio_data=audio_data,
-                    audio_base64=base64.b64encode(audio_data).decode('utf-8'),
                     metrics=metrics,
                     provider_id=self.provider_id,
                     voice_id=voice_id,
                     model_id=model,
-                    response_headers=dict(response.headers),
+                    response_headers=response.headers,
                 )
             else:
                 return TTSResult(
@@ -1804,8 +2534,6 @@ class OpenAITTSProvider(BaseTTSProvider):
     
     def _demo_synthesis(self, text: str, voice_id: str, metrics: TTSMetrics, model: str) -> TTSResult:
         """Generate demo response with simulated metrics"""
-        import random
-        
         time.sleep(0.1 + random.random() * 0.2)
         
         metrics.time_to_first_byte = 80 + random.random() * 120
@@ -1822,7 +2550,6 @@ class OpenAITTSProvider(BaseTTSProvider):
         return TTSResult(
             success=True,
             audio_data=audio_data,
-            audio_base64=base64.b64encode(audio_data).decode('utf-8'),
             metrics=metrics,
             provider_id=self.provider_id,
             voice_id=voice_id,
@@ -1834,30 +2561,51 @@ class OpenAITTSProvider(BaseTTSProvider):
 class TTSServiceManager:
     """Manager class for TTS service providers"""
     
+    PROVIDER_CLASSES = {
+        'elevenlabs': ElevenLabsProvider,
+        'google': GoogleTTSProvider,
+        'azure': AzureTTSProvider,
+        'amazon': AmazonPollyProvider,
+        'openai': OpenAITTSProvider,
+    }
+    
     _providers: Dict[str, BaseTTSProvider] = {}
+    _providers_lock = threading.Lock()
     
     @classmethod
     def get_provider(cls, provider_id: str) -> Optional[BaseTTSProvider]:
-        """Get a TTS provider by ID"""
-        if provider_id not in cls._providers:
-            provider_class = {
-                'elevenlabs': ElevenLabsProvider,
-                'google': GoogleTTSProvider,
-                'azure': AzureTTSProvider,
-                'amazon': AmazonPollyProvider,
-                'openai': OpenAITTSProvider,
-            }.get(provider_id)
-            
-            if provider_class:
-                cls._providers[provider_id] = provider_class()
+        """
+        Get a TTS provider by ID.
         
-        return cls._providers.get(provider_id)
+        Each provider is created once per process and shared, so its HTTP session,
+        voice cache and warmed connections persist across requests. Creation is
+        locked because concurrent syntheses call this from worker threads.
+        """
+        provider = cls._providers.get(provider_id)
+        if provider is not None:
+            return provider
+        
+        provider_class = cls.PROVIDER_CLASSES.get(provider_id)
+        if provider_class is None:
+            return None
+        
+        with cls._providers_lock:
+            provider = cls._providers.get(provider_id)
+            if provider is None:
+                provider = cls._providers[provider_id] = provider_class()
+                provider.prewarm()
+        return provider
+    
+    @classmethod
+    def prewarm_providers(cls):
+        """Create every configured provider so each opens its API connection ahead of use"""
+        for provider_id in settings.TTS_PROVIDERS:
+            cls.get_provider(provider_id)
     
     @classmethod
     def get_all_providers(cls) -> List[BaseTTSProvider]:
         """Get all available TTS providers"""
-        provider_ids = ['elevenlabs', 'google', 'azure', 'amazon', 'openai']
-        return [cls.get_provider(pid) for pid in provider_ids if cls.get_provider(pid)]
+        return [p for pid in cls.PROVIDER_CLASSES if (p := cls.get_provider(pid)) is not None]
     
     @classmethod
     def synthesize(cls, provider_id: str, text: str, voice_id: str, 
@@ -1871,21 +2619,167 @@ class TTSServiceManager:
                 provider_id=provider_id,
             )
         
-        if streaming:
-            return provider.synthesize_streaming(text, voice_id, **kwargs)
-        return provider.synthesize(text, voice_id, **kwargs)
+        timeout = settings.TTS_AUDIO_CACHE_TIMEOUT
+        if timeout:
+            start_ns = time.perf_counter_ns()
+            cache_key = cls.audio_cache_key(provider_id, text, voice_id, streaming, kwargs)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cls._cached_result(cached, text, streaming, provider, (time.perf_counter_ns() - start_ns) / NS_PER_MS)
+        
+        if kwargs.pop('split_sentences', False):
+            result = provider.synthesize_long(text, voice_id, streaming, **kwargs)
+        elif streaming:
+            result = provider.synthesize_streaming(text, voice_id, **kwargs)
+        else:
+            result = provider.synthesize(text, voice_id, **kwargs)
+        
+        if timeout and result.success and result.audio_data:
+            m = result.metrics
+            cache.set(cache_key, {
+                'audio_data': bytes(result.audio_data),
+                'voice_id': result.voice_id,
+                'model_id': result.model_id,
+                'audio_duration': m.audio_duration,
+                'audio_format': m.audio_format,
+                'sample_rate': m.sample_rate,
+                'bitrate': m.bitrate,
+            }, timeout)
+        return result
+    
+    @staticmethod
+    def audio_cache_key(provider_id: str, text: str, voice_id: str, streaming: bool, options: Dict[str, Any]) -> str:
+        """Content address of a synthesis request: provider, voice, text and every option"""
+        request = json.dumps([provider_id, voice_id, streaming, options, text], sort_keys=True, default=str)
+        return 'tts_audio:' + hashlib.blake2b(request.encode(), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _cached_result(cached: Dict[str, Any], text: str, streaming: bool,
+                       provider: BaseTTSProvider, lookup_time: float) -> TTSResult:
+        metrics = TTSMetrics()
+        metrics.cached = True
+        metrics.is_streaming = streaming
+        metrics.character_count, metrics.word_count = provider.get_text_metrics(text)
+        metrics.time_to_first_byte = metrics.time_to_first_audio = lookup_time
+        metrics.total_synthesis_time = lookup_time
+        metrics.audio_size = len(cached['audio_data'])
+        metrics.audio_duration = cached['audio_duration']
+        metrics.audio_format = cached['audio_format']
+        metrics.sample_rate = cached['sample_rate']
+        metrics.bitrate = cached['bitrate']
+        metrics.calculate_derived_metrics()
+        return TTSResult(
+            success=True,
+            audio_data=cached['audio_data'],
+            metrics=metrics,
+            provider_id=provider.provider_id,
+            voice_id=cached['voice_id'],
+            model_id=cached['model_id'],
+        )
+    
+    @classmethod
+    async def synthesize_async(cls, provider_id: str, text: str, voice_id: str,
+                               streaming: bool = False, **kwargs) -> TTSResult:
+        """
+        Awaitable counterpart of synthesize().
+        
+        The blocking call runs on a worker thread (not the shared thread-sensitive one),
+        so concurrent awaits overlap their network waits.
+        """
+        return await sync_to_async(cls.synthesize, thread_sensitive=False)(
+            provider_id, text, voice_id, streaming, **kwargs
+        )
+    
+    @classmethod
+    async def synthesize_multiple_async(cls, text: str, provider_configs: List[Dict[str, Any]],
+                                        streaming: bool = False) -> List[TTSResult]:
+        """Synthesize text with every configured provider concurrently (results keep config order)"""
+        return await asyncio.gather(*(
+            cls.synthesize_async(
+                config.get('provider_id'), text, config.get('voice_id'), streaming,
+                **config.get('options', {})
+            )
+            for config in provider_configs
+        ))
+    
+    @classmethod
+    async def synthesize_as_completed_async(cls, text: str, provider_configs: List[Dict[str, Any]],
+                                            streaming: bool = False) -> AsyncIterator[Tuple[int, TTSResult]]:
+        """Synthesize with every configured provider concurrently, yielding
+        (config index, result) pairs in the order the syntheses finish"""
+        async def run(index, config):
+            return index, await cls.synthesize_async(
+                config.get('provider_id'), text, config.get('voice_id'), streaming,
+                **config.get('options', {})
+            )
+        
+        for next_done in asyncio.as_completed([run(index, config) for index, config in enumerate(provider_configs)]):
+            yield await next_done
+    
+    @classmethod
+    def synthesize_as_completed(cls, text: str, provider_configs: List[Dict[str, Any]],
+                                streaming: bool = False) -> Iterator[Tuple[int, TTSResult]]:
+        """
+        Blocking iterator over synthesize_as_completed_async().
+        
+        async_to_sync() only returns once the whole fan-out is done, so it runs on a
+        helper thread that hands each pair over as soon as it is yielded.
+        """
+        done = queue.SimpleQueue()
+        
+        async def drain():
+            try:
+                async for item in cls.synthesize_as_completed_async(text, provider_configs, streaming):
+                    done.put(item)
+            except Exception as e:
+                done.put(e)
+        
+        thread = threading.Thread(target=async_to_sync(drain), daemon=True)
+        thread.start()
+        for _ in provider_configs:
+            item = done.get()
+            if isinstance(item, Exception):
+                raise item
+            yield item
+        thread.join()
+    
+    @classmethod
+    async def synthesize_sequences_async(cls, texts: List[str], provider_configs: List[Dict[str, Any]],
+                                         repeat: int = 1, streaming: bool = False) -> List[List[TTSResult]]:
+        """
+        Run every provider config through each text `repeat` times.
+        
+        Different providers run concurrently, but each provider sends its requests
+        one at a time, taking turns between its configs (e.g. two voices), so it never
+        competes with itself and its timings stay independent. Returns one result
+        list per config, in text order with repeats adjacent.
+        """
+        results = [[] for _ in provider_configs]
+        by_provider = defaultdict(list)
+        for index, config in enumerate(provider_configs):
+            by_provider[config.get('provider_id')].append(index)
+        
+        async def run(indexes):
+            for text in texts:
+                for _ in range(repeat):
+                    for index in indexes:
+                        config = provider_configs[index]
+                        results[index].append(await cls.synthesize_async(
+                            config.get('provider_id'), text, config.get('voice_id'), streaming,
+                            **config.get('options', {})
+                        ))
+        
+        await asyncio.gather(*(run(indexes) for indexes in by_provider.values()))
+        return results
+    
+    @classmethod
+    def synthesize_sequences(cls, texts: List[str], provider_configs: List[Dict[str, Any]],
+                             repeat: int = 1, streaming: bool = False) -> List[List[TTSResult]]:
+        """Blocking counterpart of synthesize_sequences_async()"""
+        return async_to_sync(cls.synthesize_sequences_async)(texts, provider_configs, repeat, streaming)
     
     @classmethod
     def synthesize_multiple(cls, text: str, provider_configs: List[Dict[str, Any]],
                            streaming: bool = False) -> List[TTSResult]:
-        """Synthesize text using multiple providers"""
-        results = []
-        for config in provider_configs:
-            provider_id = config.get('provider_id')
-            voice_id = config.get('voice_id')
-            kwargs = config.get('options', {})
-            
-            result = cls.synthesize(provider_id, text, voice_id, streaming, **kwargs)
-            results.append(result)
-        
-        return results
\ No newline at end of file
+        """Synthesize text using multiple providers, running the requests concurrently"""
+        return async_to_sync(cls.synthesize_multiple_async)(text, provider_configs, streaming)
\ No newline at end of file
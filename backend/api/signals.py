@@ -0,0 +1,23 @@
+# Signal handlers keeping cached metrics consistent with stored evaluations
+
+from django.core.cache import cache
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import TTSEvaluation
+
+
+def provider_metrics_cache_key(provider_id):
+    """Cache key for a provider's aggregated metrics (provider_id is the string id)"""
+    return f'provider_metrics:{provider_id}'
+
+
+def invalidate_provider_metrics_cache(provider_ids):
+    """Drop cached aggregates for several providers (for bulk writes that send no signals)"""
+    cache.delete_many([provider_metrics_cache_key(pid) for pid in provider_ids])
+
+
+@receiver(post_save, sender=TTSEvaluation)
+def invalidate_provider_metrics(sender, instance, **kwargs):
+    """Drop the cached aggregate for the provider a new evaluation belongs to"""
+    cache.delete(provider_metrics_cache_key(instance.provider.provider_id))
@@ -22,8 +22,10 @@ urlpatterns = [
     # Evaluation endpoints
     path('sessions/', views.get_sessions, name='get_sessions'),
     path('sessions/<uuid:session_id>/', views.get_session, name='get_session'),
+    path('sessions/<uuid:session_id>/stats/', views.get_session_stats, name='get_session_stats'),
     path('evaluations/', views.get_evaluations, name='get_evaluations'),
     path('evaluations/<int:evaluation_id>/', views.get_evaluation, name='get_evaluation'),
+    path('evaluations/<int:evaluation_id>/audio/', views.get_evaluation_audio, name='get_evaluation_audio'),
     
     # Metrics endpoints
     path('metrics/provider/<str:provider_id>/', views.get_provider_metrics, name='get_provider_metrics'),
@@ -4,9 +4,16 @@ from rest_framework import status
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse, StreamingHttpResponse
 from django.utils import timezone
-from django.db.models import Avg, Min, Max, Count
-import statistics
+from django.views.decorators.http import condition
+from django.db.models import Avg, Min, Max, Count, F, Prefetch, Q, Value, Window
+from django.db.models.functions import Floor, RowNumber
+import numpy as np
+from collections import defaultdict
+import base64
+import hashlib
 
 from .serializers import (
     SynthesisRequestSerializer,
@@ -15,10 +22,13 @@ from .serializers import (
     TTSEvaluationSerializer,
     TTSEvaluationSummarySerializer,
     EvaluationSessionSerializer,
-    EvaluationSessionListSerializer,
     BenchmarkRunSerializer,
+    evaluation_audio_url,
+    include_field,
 )
+from .renderers import ORJSONRenderer, stream_json_array
 from .services import TTSServiceManager
+from .signals import invalidate_provider_metrics_cache, provider_metrics_cache_key
 from .models import (
     TTSProvider, EvaluationSession, TTSEvaluation,
     BenchmarkRun,
@@ -27,6 +37,38 @@ from .models import (
 
 # ========== Provider Endpoints ==========
 
+# provider_id -> (voice list it was built from, payload) for provider_voice_list()
+_voice_list_payloads = {}
+
+
+def provider_voice_list(provider_id, provider):
+    """Plain voice dicts in the VoiceListSerializer shape, built in one pass over the
+    provider's voice list (Voice rows are not stored, so nothing is read from the database).
+    The payload is rebuilt only when get_voices() returns a different (refreshed) list."""
+    voices = provider.get_voices()
+    built = _voice_list_payloads.get(provider_id)
+    if built is not None and built[0] is voices:
+        return built[1]
+    
+    provider_name = provider.provider_name
+    payload = [
+        {
+            'voice_id': v['voice_id'],
+            'name': v['name'],
+            'language': v.get('language', 'en-US'),
+            'gender': v.get('gender', 'neutral'),
+            'description': v.get('description', ''),
+            'provider_id': provider_id,
+            'provider_name': provider_name,
+        }
+        for v in voices
+    ]
+    # An empty list is a failed fetch that get_voices() retries, so it is not kept
+    if voices:
+        _voice_list_payloads[provider_id] = (voices, payload)
+    return payload
+
+
 @api_view(['GET'])
 def get_providers(request):
     """Get all available TTS providers with their voices"""
@@ -35,25 +77,13 @@ def get_providers(request):
     for provider_id, config in settings.TTS_PROVIDERS.items():
         provider = TTSServiceManager.get_provider(provider_id)
         if provider:
-            voices = provider.get_voices()
             providers_data.append({
                 'provider_id': provider_id,
                 'name': provider.provider_name,
                 'description': config.get('description', ''),
                 'is_enabled': config.get('enabled', True),
                 'demo_mode': provider.demo_mode,
-                'voices': [
-                    {
-                        'voice_id': v['voice_id'],
-                        'name': v['name'],
-                        'language': v.get('language', 'en-US'),
-                        'gender': v.get('gender', 'neutral'),
-                        'description': v.get('description', ''),
-                        'provider_id': provider_id,
-                        'provider_name': provider.provider_name,
-                    }
-                    for v in voices
-                ]
+                'voices': provider_voice_list(provider_id, provider),
             })
     
     return Response({'providers': providers_data})
@@ -69,30 +99,23 @@ def get_provider_voices(request, provider_id):
             status=status.HTTP_404_NOT_FOUND
         )
     
-    voices = provider.get_voices()
-    voice_data = [
-        {
-            'voice_id': v['voice_id'],
-            'name': v['name'],
-            'language': v.get('language', 'en-US'),
-            'gender': v.get('gender', 'neutral'),
-            'description': v.get('description', ''),
-            'provider_id': provider_id,
-            'provider_name': provider.provider_name,
-        }
-        for v in voices
-    ]
-    
     return Response({
         'provider_id': provider_id,
         'provider_name': provider.provider_name,
         'demo_mode': provider.demo_mode,
-        'voices': voice_data
+        'voices': provider_voice_list(provider_id, provider)
     })
 
 
 # ========== Synthesis Endpoints ==========
 
+# TTSMetrics fields left out of synthesis responses (chunk_timings is only stored)
+RESPONSE_EXCLUDED_METRICS = ('chunk_timings',)
+
+# TTSMetrics fields with no TTSEvaluation column (cache hits are not recorded)
+EVALUATION_EXCLUDED_METRICS = ('cached',)
+
+
 @api_view(['POST'])
 def synthesize(request):
     """Synthesize text using a single TTS provider"""
@@ -133,36 +156,114 @@ def synthesize(request):
         'provider_name': provider.provider_name if provider else provider_id,
         'voice_id': result.voice_id,
         'model_id': result.model_id,
-        'audio_base64': result.audio_base64 or '',
+        'audio_base64': result.audio_base64,
         'audio_format': result.metrics.audio_format,
-        'metrics': {
-            'time_to_first_byte': result.metrics.time_to_first_byte,
-            'time_to_first_audio': result.metrics.time_to_first_audio,
-            'total_synthesis_time': result.metrics.total_synthesis_time,
-            'network_latency': result.metrics.network_latency,
-            'audio_duration': result.metrics.audio_duration,
-            'audio_size': result.metrics.audio_size,
-            'audio_format': result.metrics.audio_format,
-            'sample_rate': result.metrics.sample_rate,
-            'bitrate': result.metrics.bitrate,
-            'is_streaming': result.metrics.is_streaming,
-            'chunk_count': result.metrics.chunk_count,
-            'avg_chunk_size': result.metrics.avg_chunk_size,
-            'playback_jitter': result.metrics.playback_jitter,
-            'min_chunk_delay': result.metrics.min_chunk_delay,
-            'max_chunk_delay': result.metrics.max_chunk_delay,
-            'avg_chunk_delay': result.metrics.avg_chunk_delay,
-            'character_count': result.metrics.character_count,
-            'word_count': result.metrics.word_count,
-            'chars_per_second': result.metrics.chars_per_second,
-            'realtime_factor': result.metrics.realtime_factor,
-        },
+        'metrics': result.metrics.as_dict(exclude=RESPONSE_EXCLUDED_METRICS),
         'error_message': result.error_message,
     }
     
     return Response(response_data)
 
 
+def db_providers(provider_ids):
+    """
+    TTSProvider rows for provider_ids, keyed by provider_id.
+    
+    Existing rows are read in one query and any missing ones are inserted together,
+    instead of a get_or_create round trip per provider.
+    """
+    rows = TTSProvider.objects.in_bulk(provider_ids, field_name='provider_id')
+    missing = [pid for pid in dict.fromkeys(provider_ids) if pid not in rows]
+    if missing:
+        new_rows = []
+        for pid in missing:
+            provider = TTSServiceManager.get_provider(pid)
+            new_rows.append(TTSProvider(
+                provider_id=pid,
+                name=provider.provider_name if provider else pid,
+                description=settings.TTS_PROVIDERS.get(pid, {}).get('description', ''),
+            ))
+        # A concurrent request may have created some of them; re-read to get every pk
+        TTSProvider.objects.bulk_create(new_rows, ignore_conflicts=True)
+        rows.update(TTSProvider.objects.in_bulk(missing, field_name='provider_id'))
+    return rows
+
+
+def batch_result(session, provider_config, result, provider_rows, inline_audio=False):
+    """
+    Unsaved TTSEvaluation and response entry for one provider's result in a batch.
+    
+    The entry only embeds audio_base64 when inline_audio is set; otherwise clients
+    fetch the audio from the audio_url added by set_batch_evaluation() once saved.
+    """
+    provider_id = provider_config['provider_id']
+    voice_id = provider_config['voice_id']
+    options = provider_config.get('options', {})
+    
+    provider = TTSServiceManager.get_provider(provider_id)
+    
+    # Look up voice name from provider's available voices (voice_id if not found)
+    voice_name = provider.get_voice_name(voice_id) if provider else voice_id
+    
+    evaluation = TTSEvaluation(
+        session=session,
+        provider=provider_rows[provider_id],
+        voice_id_str=voice_id,
+        voice_name=voice_name,
+        model_id=result.model_id,
+        success=result.success,
+        error_message=result.error_message,
+        **result.metrics.as_dict(exclude=EVALUATION_EXCLUDED_METRICS),
+        request_params=options,
+        response_headers=dict(result.response_headers),
+        audio_base64=result.audio_base64,
+    )
+    
+    entry = {
+        'success': result.success,
+        'provider_id': result.provider_id,
+        'provider_name': provider.provider_name if provider else provider_id,
+        'voice_id': result.voice_id,
+        'model_id': result.model_id,
+        'audio_format': result.metrics.audio_format,
+        'metrics': result.metrics.as_dict(exclude=RESPONSE_EXCLUDED_METRICS),
+        'error_message': result.error_message,
+    }
+    if inline_audio:
+        entry['audio_base64'] = result.audio_base64
+    return evaluation, entry
+
+
+def set_batch_evaluation(request, entry, evaluation):
+    """Point a batch response entry at its saved evaluation and that evaluation's audio"""
+    entry['evaluation_id'] = evaluation.id
+    entry['audio_url'] = evaluation_audio_url(request, evaluation.id) if evaluation.audio_base64 else None
+
+
+def stream_batch_results(request, session, text, providers, streaming, provider_rows, inline_audio):
+    """
+    NDJSON body of a streamed batch: a header line describing the session, then one
+    line per provider result in the order the syntheses finish. Each evaluation is
+    saved as its result arrives; the session is completed when the stream ends.
+    """
+    renderer = ORJSONRenderer()
+    try:
+        yield renderer.render({
+            'session_id': str(session.session_id),
+            'text': text,
+            'timestamp': session.created_at,
+        }) + b'\n'
+        for index, result in TTSServiceManager.synthesize_as_completed(text, providers, streaming):
+            evaluation, entry = batch_result(session, providers[index], result, provider_rows, inline_audio)
+            evaluation.save()
+            set_batch_evaluation(request, entry, evaluation)
+            yield renderer.render(entry) + b'\n'
+    finally:
+        session.status = 'completed'
+        session.completed_at = timezone.now()
+        session.save()
+
+
 @api_view(['POST'])
 def synthesize_batch(request):
     """Synthesize text using multiple TTS providers"""
@@ -187,104 +288,36 @@ def synthesize_batch(request):
         status='running'
     )
     
-    results = []
+    provider_rows = db_providers([config['provider_id'] for config in providers])
+    # Audio is returned as a URL unless the client asks for it inline (?inline_audio=1)
+    inline_audio = request.query_params.get('inline_audio', '').lower() in ('1', 'true')
     
-    for provider_config in providers:
-        provider_id = provider_config['provider_id']
-        voice_id = provider_config['voice_id']
-        options = provider_config.get('options', {})
-        
-        # Perform synthesis
-        result = TTSServiceManager.synthesize(provider_id, text, voice_id, streaming, **options)
-        
-        provider = TTSServiceManager.get_provider(provider_id)
-        
-        # Look up voice name from provider's available voices
-        voice_name = voice_id  # Default to voice_id if name not found
-        if provider:
-            voices = provider.get_voices()
-            for v in voices:
-                if v.get('voice_id') == voice_id:
-                    voice_name = v.get('name', voice_id)
-                    break
-        
-        # Get or create provider in database
-        db_provider, _ = TTSProvider.objects.get_or_create(
-            provider_id=provider_id,
-            defaults={
-                'name': provider.provider_name if provider else provider_id,
-                'description': settings.TTS_PROVIDERS.get(provider_id, {}).get('description', ''),
-            }
-        )
-        
-        # Create evaluation record
-        evaluation = TTSEvaluation.objects.create(
-            session=session,
-            provider=db_provider,
-            voice_id_str=voice_id,
-            voice_name=voice_name,
-            model_id=result.model_id,
-            success=result.success,
-            error_message=result.error_message,
-            time_to_first_byte=result.metrics.time_to_first_byte,
-            time_to_first_audio=result.metrics.time_to_first_audio,
-            total_synthesis_time=result.metrics.total_synthesis_time,
-            network_latency=result.metrics.network_latency,
-            audio_duration=result.metrics.audio_duration,
-            audio_size=result.metrics.audio_size,
-            audio_format=result.metrics.audio_format,
-            sample_rate=result.metrics.sample_rate,
-            bitrate=result.metrics.bitrate,
-            is_streaming=result.metrics.is_streaming,
-            chunk_count=result.metrics.chunk_count,
-            avg_chunk_size=result.metrics.avg_chunk_size,
-            chunk_timings=result.metrics.chunk_timings,
-            playback_jitter=result.metrics.playback_jitter,
-            min_chunk_delay=result.metrics.min_chunk_delay,
-            max_chunk_delay=result.metrics.max_chunk_delay,
-            avg_chunk_delay=result.metrics.avg_chunk_delay,
-            character_count=result.metrics.character_count,
-            word_count=result.metrics.word_count,
-            chars_per_second=result.metrics.chars_per_second,
-            realtime_factor=result.metrics.realtime_factor,
-            request_params=options,
-            response_headers=result.response_headers,
-            audio_base64=result.audio_base64 or '',
+    # Streamed batches send each provider's result as soon as it is ready
+    if data.get('stream_results'):
+        return StreamingHttpResponse(
+            stream_batch_results(request, session, text, providers, streaming, provider_rows, inline_audio),
+            content_type='application/x-ndjson'
         )
-        
-        results.append({
-            'success': result.success,
-            'provider_id': result.provider_id,
-            'provider_name': provider.provider_name if provider else provider_id,
-            'voice_id': result.voice_id,
-            'model_id': result.model_id,
-            'audio_base64': result.audio_base64 or '',
-            'audio_format': result.metrics.audio_format,
-            'metrics': {
-                'time_to_first_byte': result.metrics.time_to_first_byte,
-                'time_to_first_audio': result.metrics.time_to_first_audio,
-                'total_synthesis_time': result.metrics.total_synthesis_time,
-                'network_latency': result.metrics.network_latency,
-                'audio_duration': result.metrics.audio_duration,
-                'audio_size': result.metrics.audio_size,
-                'audio_format': result.metrics.audio_format,
-                'sample_rate': result.metrics.sample_rate,
-                'bitrate': result.metrics.bitrate,
-                'is_streaming': result.metrics.is_streaming,
-                'chunk_count': result.metrics.chunk_count,
-                'avg_chunk_size': result.metrics.avg_chunk_size,
-                'playback_jitter': result.metrics.playback_jitter,
-                'min_chunk_delay': result.metrics.min_chunk_delay,
-                'max_chunk_delay': result.metrics.max_chunk_delay,
-                'avg_chunk_delay': result.metrics.avg_chunk_delay,
-                'character_count': result.metrics.character_count,
-                'word_count': result.metrics.word_count,
-                'chars_per_second': result.metrics.chars_per_second,
-                'realtime_factor': result.metrics.realtime_factor,
-            },
-            'error_message': result.error_message,
-            'evaluation_id': evaluation.id,
-        })
+    
+    results = []
+    evaluations = []
+    
+    # Run every provider's synthesis concurrently; results come back in request order
+    synthesis_results = TTSServiceManager.synthesize_multiple(text, providers, streaming)
+    
+    for provider_config, result in zip(providers, synthesis_results):
+        # Evaluation records are all inserted together below
+        evaluation, entry = batch_result(session, provider_config, result, provider_rows, inline_audio)
+        evaluations.append(evaluation)
+        results.append(entry)
+    
+    # One multi-row INSERT for the whole batch instead of one per provider
+    TTSEvaluation.objects.bulk_create(evaluations, batch_size=500)
+    for entry, evaluation in zip(results, evaluations):
+        set_batch_evaluation(request, entry, evaluation)
+    
+    # bulk_create sends no post_save, so invalidate cached provider metrics here
+    invalidate_provider_metrics_cache({e.provider.provider_id for e in evaluations})
     
     # Update session status
     session.status = 'completed'
@@ -301,45 +334,171 @@ def synthesize_batch(request):
 
 # ========== Evaluation Endpoints ==========
 
+# Model columns of the session list rows (see EvaluationSessionListSerializer)
+SESSION_LIST_FIELDS = [
+    'id', 'session_id', 'name', 'text', 'status', 'created_at', 'completed_at',
+]
+
+# Model columns of the evaluation list rows (see TTSEvaluationSummarySerializer)
+EVALUATION_LIST_FIELDS = [
+    'id', 'voice_id_str', 'voice_name', 'success',
+    'time_to_first_audio', 'total_synthesis_time', 'playback_jitter',
+    'audio_duration', 'realtime_factor', 'created_at',
+]
+
+
+# Rows fetched per database round trip while streaming the session list
+SESSION_LIST_CHUNK_SIZE = 2000
+
+
 @api_view(['GET'])
 def get_sessions(request):
     """Get list of evaluation sessions"""
     limit = int(request.query_params.get('limit', 20))
-    sessions = EvaluationSession.objects.all()[:limit]
-    serializer = EvaluationSessionListSerializer(sessions, many=True)
-    return Response(serializer.data)
+    # Annotate both counts so listing N sessions is one query rather than 2N COUNTs, and
+    # emit plain rows (same shape as EvaluationSessionListSerializer) without model instances
+    sessions = EvaluationSession.objects.with_counts().values(
+        *SESSION_LIST_FIELDS,
+        evaluation_count=F('eval_count'),
+        successful_evaluations=F('success_count'),
+    )[:limit]
+    # Stream the rows in fixed-size chunks so large limits never hold the whole list in memory
+    return StreamingHttpResponse(
+        stream_json_array(sessions.iterator(chunk_size=SESSION_LIST_CHUNK_SIZE)),
+        content_type='application/json'
+    )
+
+
+def session_detail_queryset(request=None):
+    """Sessions with counts annotated and their evaluations prefetched as narrow rows
+    (only the columns the nested summary serializer will output)"""
+    evaluations = TTSEvaluationSummarySerializer.setup_eager_loading(TTSEvaluation.objects.all(), request)
+    return EvaluationSession.objects.with_counts().prefetch_related(
+        Prefetch('evaluations', queryset=evaluations)
+    )
 
 
 @api_view(['GET'])
 def get_session(request, session_id):
     """Get a specific evaluation session with all evaluations"""
     try:
-        session = EvaluationSession.objects.get(session_id=session_id)
+        session = session_detail_queryset(request).get(session_id=session_id)
     except EvaluationSession.DoesNotExist:
         return Response(
             {'error': 'Session not found'},
             status=status.HTTP_404_NOT_FOUND
         )
     
-    serializer = EvaluationSessionSerializer(session)
+    serializer = EvaluationSessionSerializer(session, context={'request': request})
     return Response(serializer.data)
 
 
+# Metrics summarized per provider by the session stats endpoint
+SESSION_STATS_METRICS = [
+    'time_to_first_audio', 'total_synthesis_time', 'playback_jitter',
+    'audio_duration', 'realtime_factor',
+]
+
+
+def session_stats_etag(request, session_id):
+    """ETag for a session's stats; evaluations are append-only, so count + newest id identify the content"""
+    agg = TTSEvaluation.objects.filter(session__session_id=session_id).aggregate(
+        count=Count('id'), latest=Max('id')
+    )
+    if not agg['count']:
+        return None
+    return f"{session_id}-{agg['count']}-{agg['latest']}"
+
+
+@condition(etag_func=session_stats_etag)
+@api_view(['GET'])
+def get_session_stats(request, session_id):
+    """Get per-provider min/max/avg metrics for a session, aggregated in the database"""
+    try:
+        session = EvaluationSession.objects.get(session_id=session_id)
+    except EvaluationSession.DoesNotExist:
+        return Response(
+            {'error': 'Session not found'},
+            status=status.HTTP_404_NOT_FOUND
+        )
+    
+    aggregates = {}
+    for m in SESSION_STATS_METRICS:
+        aggregates[f'{m}_min'] = Min(m)
+        aggregates[f'{m}_max'] = Max(m)
+        aggregates[f'{m}_avg'] = Avg(m)
+    
+    # Single GROUP BY provider query; newest provider first to match the session detail ordering
+    rows = (
+        TTSEvaluation.objects
+        .filter(session=session)
+        .values('provider__name')
+        .annotate(evaluation_count=Count('id'), latest=Max('created_at'), **aggregates)
+        .order_by('-latest')
+    )
+    
+    providers = [
+        {
+            'provider_name': row['provider__name'],
+            'evaluation_count': row['evaluation_count'],
+            'metrics': {
+                m: {
+                    'min': row[f'{m}_min'],
+                    'max': row[f'{m}_max'],
+                    'avg': row[f'{m}_avg'],
+                }
+                for m in SESSION_STATS_METRICS
+            },
+        }
+        for row in rows
+    ]
+    
+    return Response({
+        'session_id': str(session.session_id),
+        'name': session.name,
+        'total_evaluations': sum(p['evaluation_count'] for p in providers),
+        'providers': providers,
+    })
+
+
 @api_view(['GET'])
 def get_evaluation(request, evaluation_id):
     """Get a specific evaluation with full details"""
     try:
-        evaluation = TTSEvaluation.objects.get(id=evaluation_id)
+        evaluation = TTSEvaluationSerializer.setup_eager_loading(
+            TTSEvaluation.objects.all(), request
+        ).get(id=evaluation_id)
     except TTSEvaluation.DoesNotExist:
         return Response(
             {'error': 'Evaluation not found'},
             status=status.HTTP_404_NOT_FOUND
         )
     
-    serializer = TTSEvaluationSerializer(evaluation)
+    serializer = TTSEvaluationSerializer(evaluation, context={'request': request})
     return Response(serializer.data)
 
 
+# Content types for stored audio formats that are not simply audio/<format>
+AUDIO_CONTENT_TYPES = {'mp3': 'audio/mpeg', 'pcm': 'audio/L16'}
+
+
+@api_view(['GET'])
+def get_evaluation_audio(request, evaluation_id):
+    """Get the stored audio of an evaluation as a binary file"""
+    row = TTSEvaluation.objects.filter(id=evaluation_id).values('audio_base64', 'audio_format').first()
+    if row is None or not row['audio_base64']:
+        return Response(
+            {'error': 'Audio not found'},
+            status=status.HTTP_404_NOT_FOUND
+        )
+    
+    audio_format = row['audio_format'] or 'mp3'
+    return HttpResponse(
+        base64.b64decode(row['audio_base64']),
+        content_type=AUDIO_CONTENT_TYPES.get(audio_format, f'audio/{audio_format}')
+    )
+
+
 @api_view(['GET'])
 def get_evaluations(request):
     """Get list of evaluations with optional filtering"""
@@ -355,27 +514,78 @@ def get_evaluations(request):
     if success_only:
         evaluations = evaluations.filter(success=True)
     
-    evaluations = evaluations[:limit]
-    serializer = TTSEvaluationSummarySerializer(evaluations, many=True)
-    return Response(serializer.data)
+    # Plain rows in the TTSEvaluationSummarySerializer shape, honouring ?fields= / ?omit=
+    fields = [f for f in EVALUATION_LIST_FIELDS if include_field(request, f)]
+    expressions = {'provider_name': F('provider__name')} if include_field(request, 'provider_name') else {}
+    
+    evaluations = evaluations.values(*fields, **expressions)[:limit]
+    return Response(list(evaluations))
 
 
 # ========== Metrics Endpoints ==========
 
+# Nearest-rank percentiles of total_synthesis_time: (quantile, minimum sample count)
+PERCENTILES = ((0.5, 1), (0.95, 20), (0.99, 100))
+
+
+def synthesis_time_percentiles(evaluations):
+    """
+    p50/p95/p99 of total_synthesis_time for each provider in an evaluation queryset.
+    
+    Returns {provider_id: (p50, p95, p99)}. The ranking is done by the database with
+    window functions, so only the (at most three) selected rows per provider are
+    fetched. Ranks use index int(n * q); p95 needs at least 20 values and p99 at
+    least 100.
+    """
+    partition = F('provider__provider_id')
+    ranked = (
+        evaluations
+        .filter(total_synthesis_time__isnull=False)
+        .order_by()
+        .annotate(
+            n=Window(Count('id'), partition_by=partition),
+            pos=Window(RowNumber(), partition_by=partition, order_by=F('total_synthesis_time').asc()) - 1,
+        )
+    )
+    wanted = Q()
+    for q, min_n in PERCENTILES:
+        wanted |= Q(pos=Floor(F('n') * Value(q)), n__gte=min_n)
+    
+    ranks = defaultdict(dict)
+    for pid, n, pos, value in ranked.filter(wanted).values_list(
+        'provider__provider_id', 'n', 'pos', 'total_synthesis_time'
+    ):
+        for q, min_n in PERCENTILES:
+            if n >= min_n and int(n * q) == pos:
+                ranks[pid][q] = value
+    return {pid: tuple(values.get(q) for q, _ in PERCENTILES) for pid, values in ranks.items()}
+
+
 @api_view(['GET'])
 def get_provider_metrics(request, provider_id):
     """Get aggregated metrics for a specific provider"""
+    # Served from cache until a new evaluation for this provider is saved (see signals)
+    cache_key = provider_metrics_cache_key(provider_id)
+    data = cache.get(cache_key)
+    if data is None:
+        data = compute_provider_metrics(provider_id)
+        cache.set(cache_key, data, settings.METRICS_CACHE_TIMEOUT)
+    return Response(data)
+
+
+def compute_provider_metrics(provider_id):
+    """Aggregate a provider's stored evaluations into the metrics response payload"""
     evaluations = TTSEvaluation.objects.filter(
         provider__provider_id=provider_id,
         success=True
     )
     
     if not evaluations.exists():
-        return Response({
+        return {
             'provider_id': provider_id,
             'total_evaluations': 0,
             'message': 'No successful evaluations found'
-        })
+        }
     
     # Calculate aggregates
     agg = evaluations.aggregate(
@@ -390,16 +600,7 @@ def get_provider_metrics(request, provider_id):
     )
     
     # Calculate percentiles
-    synthesis_times = list(evaluations.values_list('total_synthesis_time', flat=True))
-    synthesis_times = [t for t in synthesis_times if t is not None]
-    synthesis_times.sort()
-    
-    p50 = p95 = p99 = None
-    if synthesis_times:
-        n = len(synthesis_times)
-        p50 = synthesis_times[int(n * 0.5)]
-        p95 = synthesis_times[int(n * 0.95)] if n >= 20 else None
-        p99 = synthesis_times[int(n * 0.99)] if n >= 100 else None
+    p50, p95, p99 = synthesis_time_percentiles(evaluations).get(provider_id, (None, None, None))
     
     # Success rate
     total_all = TTSEvaluation.objects.filter(provider__provider_id=provider_id).count()
@@ -407,7 +608,7 @@ def get_provider_metrics(request, provider_id):
     
     provider = TTSServiceManager.get_provider(provider_id)
     
-    return Response({
+    return {
         'provider_id': provider_id,
         'provider_name': provider.provider_name if provider else provider_id,
         'total_evaluations': total_all,
@@ -423,54 +624,76 @@ def get_provider_metrics(request, provider_id):
         'p50_synthesis_time': round(p50, 2) if p50 else None,
         'p95_synthesis_time': round(p95, 2) if p95 else None,
         'p99_synthesis_time': round(p99, 2) if p99 else None,
-    })
+    }
+
 
+def comparison_evaluations(provider_ids):
+    """Evaluations covered by the comparison endpoint, optionally limited to some providers"""
+    evaluations = TTSEvaluation.objects.order_by()
+    if provider_ids:
+        evaluations = evaluations.filter(provider__provider_id__in=provider_ids)
+    return evaluations
 
+
+def comparison_metrics_etag(request):
+    """ETag for the comparison payload; evaluations are append-only, so the provider filter
+    plus count + newest id identify the content. Kept on the request, since the view
+    reuses it as its cache key after @condition has computed it"""
+    if not hasattr(request, 'comparison_etag'):
+        provider_ids = sorted(request.GET.getlist('provider_ids'))
+        agg = comparison_evaluations(provider_ids).aggregate(count=Count('id'), latest=Max('id'))
+        key = f"{','.join(provider_ids)}|{agg['count']}|{agg['latest']}"
+        request.comparison_etag = hashlib.md5(key.encode()).hexdigest()
+    return request.comparison_etag
+
+
+@condition(etag_func=comparison_metrics_etag)
 @api_view(['GET'])
 def get_comparison_metrics(request):
     """Get comparison metrics across all providers"""
-    provider_ids = request.query_params.getlist('provider_ids')
+    # Keyed by the ETag (already computed by @condition), so a new or deleted
+    # evaluation simply misses the cache
+    cache_key = f'comparison_metrics:{comparison_metrics_etag(request)}'
+    data = cache.get(cache_key)
+    if data is None:
+        data = compute_comparison_metrics(request.query_params.getlist('provider_ids'))
+        cache.set(cache_key, data, settings.METRICS_CACHE_TIMEOUT)
+    return Response(data)
+
+
+def compute_comparison_metrics(provider_ids):
+    """Aggregate stored evaluations into the per-provider comparison payload"""
+    # Aggregate every provider in one GROUP BY query instead of three queries per provider
+    evaluations = comparison_evaluations(provider_ids)
+    
+    successful = Q(success=True)
+    rows = (
+        evaluations
+        .values('provider__provider_id')
+        .annotate(
+            total_all=Count('id'),
+            total=Count('id', filter=successful),
+            avg_ttfb=Avg('time_to_first_byte', filter=successful),
+            avg_ttfa=Avg('time_to_first_audio', filter=successful),
+            avg_total=Avg('total_synthesis_time', filter=successful),
+            avg_jitter=Avg('playback_jitter', filter=successful),
+            avg_audio_duration=Avg('audio_duration', filter=successful),
+            avg_rtf=Avg('realtime_factor', filter=successful),
+        )
+        .filter(total__gt=0)
+    )
     
-    if not provider_ids:
-        # Get all providers with evaluations (use set to ensure uniqueness)
-        provider_ids = list(set(
-            TTSEvaluation.objects
-            .values_list('provider__provider_id', flat=True)
-        ))
+    # Percentiles for every provider come back from one more query
+    percentiles = synthesis_time_percentiles(evaluations.filter(success=True))
     
     comparison_data = []
     
-    for pid in provider_ids:
-        evaluations = TTSEvaluation.objects.filter(
-            provider__provider_id=pid,
-            success=True
-        )
-        
-        if not evaluations.exists():
-            continue
-        
-        agg = evaluations.aggregate(
-            total=Count('id'),
-            avg_ttfb=Avg('time_to_first_byte'),
-            avg_ttfa=Avg('time_to_first_audio'),
-            avg_total=Avg('total_synthesis_time'),
-            avg_jitter=Avg('playback_jitter'),
-            avg_audio_duration=Avg('audio_duration'),
-            avg_rtf=Avg('realtime_factor'),
-        )
-        
-        synthesis_times = list(evaluations.values_list('total_synthesis_time', flat=True))
-        synthesis_times = [t for t in synthesis_times if t is not None]
-        synthesis_times.sort()
+    for agg in rows:
+        pid = agg['provider__provider_id']
         
-        p50 = p95 = p99 = None
-        if synthesis_times:
-            n = len(synthesis_times)
-            p50 = synthesis_times[int(n * 0.5)]
-            p95 = synthesis_times[int(n * 0.95)] if n >= 20 else None
-            p99 = synthesis_times[int(n * 0.99)] if n >= 100 else None
+        p50, p95, p99 = percentiles.get(pid, (None, None, None))
         
-        total_all = TTSEvaluation.objects.filter(provider__provider_id=pid).count()
+        total_all = agg['total_all']
         success_rate = (agg['total'] / total_all * 100) if total_all > 0 else 0
         
         provider = TTSServiceManager.get_provider(pid)
@@ -494,7 +717,7 @@ def get_comparison_metrics(request):
     # Sort by average total synthesis time
     comparison_data.sort(key=lambda x: x.get('avg_total_time') or float('inf'))
     
-    return Response({'providers': comparison_data})
+    return {'providers': comparison_data}
 
 
 @api_view(['POST'])
@@ -509,6 +732,9 @@ def reset_metrics(request):
         session_count = EvaluationSession.objects.count()
         EvaluationSession.objects.all().delete()
         
+        # Bulk deletes bypass the post_save invalidation, so drop cached provider metrics here
+        invalidate_provider_metrics_cache(TTSProvider.objects.values_list('provider_id', flat=True))
+        
         return Response({
             'success': True,
             'message': f'Reset complete. Deleted {eval_count} evaluations and {session_count} sessions.',
@@ -543,67 +769,60 @@ def create_benchmark(request):
         started_at=timezone.now()
     )
     
+    # Per-provider accumulators are created on first use, so the hot loop does a
+    # single lookup per result instead of an `in` check followed by repeated indexing
     results_summary = {
-        'providers': {},
+        'providers': defaultdict(lambda: {
+            'synthesis_times': [],
+            'ttfa_times': [],
+            'jitter_values': [],
+            'successes': 0,
+            'failures': 0,
+        }),
         'test_results': []
     }
     
-    # Run benchmark
-    for text in data['test_texts']:
-        for iteration in range(data.get('iterations', 3)):
-            for provider_config in data['provider_configs']:
-                provider_id = provider_config['provider_id']
-                voice_id = provider_config['voice_id']
-                options = provider_config.get('options', {})
-                
-                # Perform synthesis
-                result = TTSServiceManager.synthesize(
-                    provider_id, text, voice_id, False, **options
-                )
-                
-                # Store result
-                if provider_id not in results_summary['providers']:
-                    results_summary['providers'][provider_id] = {
-                        'synthesis_times': [],
-                        'ttfa_times': [],
-                        'jitter_values': [],
-                        'successes': 0,
-                        'failures': 0,
-                    }
-                
-                if result.success:
-                    results_summary['providers'][provider_id]['successes'] += 1
-                    if result.metrics.total_synthesis_time:
-                        results_summary['providers'][provider_id]['synthesis_times'].append(
-                            result.metrics.total_synthesis_time
-                        )
-                    if result.metrics.time_to_first_audio:
-                        results_summary['providers'][provider_id]['ttfa_times'].append(
-                            result.metrics.time_to_first_audio
-                        )
-                    if result.metrics.playback_jitter:
-                        results_summary['providers'][provider_id]['jitter_values'].append(
-                            result.metrics.playback_jitter
-                        )
-                else:
-                    results_summary['providers'][provider_id]['failures'] += 1
+    # Run benchmark: providers run side by side, each working through its texts and
+    # iterations on its own, so no iteration waits for the slowest provider
+    runs = TTSServiceManager.synthesize_sequences(
+        data['test_texts'], data['provider_configs'], data.get('iterations', 3)
+    )
+    
+    for provider_config, results in zip(data['provider_configs'], runs):
+        provider_stats = results_summary['providers'][provider_config['provider_id']]
+        
+        for result in results:
+            if result.success:
+                provider_stats['successes'] += 1
+                if result.metrics.total_synthesis_time:
+                    provider_stats['synthesis_times'].append(result.metrics.total_synthesis_time)
+                if result.metrics.time_to_first_audio:
+                    provider_stats['ttfa_times'].append(result.metrics.time_to_first_audio)
+                if result.metrics.playback_jitter:
+                    provider_stats['jitter_values'].append(result.metrics.playback_jitter)
+            else:
+                provider_stats['failures'] += 1
+    
+    # Plain dict again for storage and serialization
+    results_summary['providers'] = dict(results_summary['providers'])
     
     # Calculate summary statistics
     for provider_id, data in results_summary['providers'].items():
-        times = data['synthesis_times']
-        if times:
-            data['avg_synthesis_time'] = statistics.mean(times)
-            data['min_synthesis_time'] = min(times)
-            data['max_synthesis_time'] = max(times)
-            data['std_synthesis_time'] = statistics.stdev(times) if len(times) > 1 else 0
+        times = np.asarray(data['synthesis_times'], dtype=np.float64)
+        if times.size:
+            data['avg_synthesis_time'] = float(times.mean())
+            data['min_synthesis_time'] = float(times.min())
+            data['max_synthesis_time'] = float(times.max())
+            # Sample standard deviation, as statistics.stdev
+            data['std_synthesis_time'] = float(times.std(ddof=1)) if times.size > 1 else 0
         
         ttfa = data['ttfa_times']
         if ttfa:
-            data['avg_ttfa'] = statistics.mean(ttfa)
+            data['avg_ttfa'] = float(np.mean(ttfa))
         
         jitter = data['jitter_values']
         if jitter:
-            data['avg_jitter'] = statistics.mean(jitter)
+            data['avg_jitter'] = float(np.mean(jitter))
         
         total = data['successes'] + data['failures']
         data['success_rate'] = (data['successes'] / total * 100) if total > 0 else 0
@@ -624,11 +843,19 @@ def create_benchmark(request):
     })
 
 
+def benchmark_queryset():
+    """Benchmarks with providers prefetched and their available voices counted in one query"""
+    providers = TTSProvider.objects.annotate(
+        available_voice_count=Count('voices', filter=Q(voices__is_available=True))
+    )
+    return BenchmarkRun.objects.prefetch_related(Prefetch('providers', queryset=providers))
+
+
 @api_view(['GET'])
 def get_benchmarks(request):
     """Get list of benchmarks"""
     limit = int(request.query_params.get('limit', 10))
-    benchmarks = BenchmarkRun.objects.all()[:limit]
+    benchmarks = benchmark_queryset()[:limit]
     serializer = BenchmarkRunSerializer(benchmarks, many=True)
     return Response(serializer.data)
 
@@ -637,7 +864,7 @@ def get_benchmarks(request):
 def get_benchmark(request, benchmark_id):
     """Get a specific benchmark"""
     try:
-        benchmark = BenchmarkRun.objects.get(benchmark_id=benchmark_id)
+        benchmark = benchmark_queryset().get(benchmark_id=benchmark_id)
     except BenchmarkRun.DoesNotExist:
         return Response(
             {'error': 'Benchmark not found'},
@@ -671,21 +898,6 @@ def health_check(request):
     })
 
 
-# Decorator to accept GET requests
-# Return session by session id
-@api_view(['GET'])
-def get_session(request, session_id):
-    try:
-        session = EvaluationSession.objects.get(session_id=session_id)
-        serializer = EvaluationSessionSerializer(session)
-        return Response(serializer.data)
-    except EvaluationSession.DoesNotExist:
-        return Response(
-            {'error': 'Session not found'}, 
-            status=status.HTTP_404_NOT_FOUND
-        )
-
-
 # ========== Batch CSV Upload ==========
 
 @api_view(['POST'])
@@ -857,12 +1069,7 @@ def batch_execute_task(request):
     result = TTSServiceManager.synthesize(provider_id, prompt, voice_id, streaming)
     
     # Look up voice name
-    voice_name = voice_id
-    voices = provider.get_voices()
-    for v in voices:
-        if v.get('voice_id') == voice_id:
-            voice_name = v.get('name', voice_id)
-            break
+    voice_name = provider.get_voice_name(voice_id)
     
     # Get or create provider in database
     db_provider, _ = TTSProvider.objects.get_or_create(
@@ -882,30 +1089,10 @@ def batch_execute_task(request):
         model_id=result.model_id,
         success=result.success,
         error_message=result.error_message,
-        time_to_first_byte=result.metrics.time_to_first_byte,
-        time_to_first_audio=result.metrics.time_to_first_audio,
-        total_synthesis_time=result.metrics.total_synthesis_time,
-        network_latency=result.metrics.network_latency,
-        audio_duration=result.metrics.audio_duration,
-        audio_size=result.metrics.audio_size,
-        audio_format=result.metrics.audio_format,
-        sample_rate=result.metrics.sample_rate,
-        bitrate=result.metrics.bitrate,
-        is_streaming=result.metrics.is_streaming,
-        chunk_count=result.metrics.chunk_count,
-        avg_chunk_size=result.metrics.avg_chunk_size,
-        chunk_timings=result.metrics.chunk_timings,
-        playback_jitter=result.metrics.playback_jitter,
-        min_chunk_delay=result.metrics.min_chunk_delay,
-        max_chunk_delay=result.metrics.max_chunk_delay,
-        avg_chunk_delay=result.metrics.avg_chunk_delay,
-        character_count=result.metrics.character_count,
-        word_count=result.metrics.word_count,
-        chars_per_second=result.metrics.chars_per_second,
-        realtime_factor=result.metrics.realtime_factor,
+        **result.metrics.as_dict(exclude=EVALUATION_EXCLUDED_METRICS),
         request_params={'prompt': prompt},
-        response_headers=result.response_headers,
-        audio_base64=result.audio_base64 or '',
+        response_headers=dict(result.response_headers),
+        audio_base64=result.audio_base64,
     )
     
     # Update session status
@@ -926,6 +1113,7 @@ def batch_execute_task(request):
             'total_synthesis_time': result.metrics.total_synthesis_time,
             'audio_duration': result.metrics.audio_duration,
             'realtime_factor': result.metrics.realtime_factor,
+            'cached': result.metrics.cached,
             'playback_jitter': result.metrics.playback_jitter,
         },
         'error_message': result.error_message,
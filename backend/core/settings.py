@@ -100,10 +100,55 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.AllowAny',
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'api.renderers.ORJSONRenderer',
     ],
 }
 
+# Provider diagnostics (api.services) go to the console; DEMO MODE and missing
+# dependency notices are warnings, client setup details are info
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'api': {'handlers': ['console'], 'level': 'INFO'},
+    },
+}
+
+# Cache for computed metrics; set REDIS_URL to share it across worker processes.
+# Without it each process has its own LocMemCache, so the post_save invalidation in
+# api/signals.py only clears the saving process's copy and other workers can serve
+# stale provider metrics for up to METRICS_CACHE_TIMEOUT seconds.
+REDIS_URL = os.getenv('REDIS_URL')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Seconds before cached provider metrics are recomputed
+METRICS_CACHE_TIMEOUT = int(os.getenv('METRICS_CACHE_TIMEOUT', '300'))
+
+# Seconds provider voice lists are cached before being fetched from the provider API again
+VOICES_CACHE_TIMEOUT = int(os.getenv('VOICES_CACHE_TIMEOUT', '3600'))
+
+# Seconds synthesized audio is reused for an identical request (same provider, voice, text
+# and options); 0 disables it. Cached results are flagged and carry no provider timings.
+TTS_AUDIO_CACHE_TIMEOUT = int(os.getenv('TTS_AUDIO_CACHE_TIMEOUT', '0'))
+
+# Open provider API connections when the app starts instead of on the first synthesis
+TTS_PREWARM_CONNECTIONS = os.getenv('TTS_PREWARM_CONNECTIONS', 'false').lower() == 'true'
+
 # Defines frontend dev servers
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",
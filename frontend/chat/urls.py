@@ -13,6 +13,7 @@ urlpatterns = [
     path('api/synthesize/', views.synthesize, name='synthesize'),
     path('api/synthesize/batch/', views.synthesize_batch, name='synthesize_batch'),
     path('api/sessions/<uuid:session_id>/', views.get_session, name='get_session'),
+    path('api/evaluations/<int:evaluation_id>/audio/', views.get_evaluation_audio, name='get_evaluation_audio'),
     path('api/metrics/provider/<str:provider_id>/', views.get_provider_metrics, name='get_provider_metrics'),
     path('api/metrics/comparison/', views.get_comparison_metrics, name='get_comparison_metrics'),
     path('api/metrics/reset/', views.reset_metrics, name='reset_metrics'),
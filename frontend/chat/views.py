@@ -2,7 +2,7 @@
 
 import requests
 from django.shortcuts import render
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 from django.conf import settings
 from django.views.decorators.http import require_http_methods
 import json
@@ -94,15 +94,48 @@ def synthesize_batch(request):
         return JsonResponse({'error': 'Invalid JSON'}, status=400)
 
 
+def _stream_body(response, chunk_size=64 * 1024):
+    """Yield a streamed backend response body, closing the connection when done"""
+    with response:
+        yield from response.iter_content(chunk_size=chunk_size)
+
+
 @require_http_methods(["GET"])
 def get_session(request, session_id):
     """Get details of a specific evaluation session"""
     try:
+        # A session lists a summary row (no audio) for each of its evaluations, which
+        # adds up for long sessions; relay the backend's JSON bytes as they arrive
+        # instead of parsing and re-serializing them. Audio is fetched per evaluation
         response = requests.get(
             f"{settings.BACKEND_API_URL}/sessions/{session_id}/",
-            timeout=10
+            params=request.GET,
+            timeout=10,
+            stream=True
+        )
+        return StreamingHttpResponse(
+            _stream_body(response),
+            status=response.status_code,
+            content_type=response.headers.get('Content-Type', 'application/json')
+        )
+    except requests.RequestException as e:
+        return JsonResponse({'error': f'Backend connection error: {str(e)}'}, status=503)
+
+
+@require_http_methods(["GET"])
+def get_evaluation_audio(request, evaluation_id):
+    """Relay the stored audio of an evaluation (batch results link to it by URL)"""
+    try:
+        response = requests.get(
+            f"{settings.BACKEND_API_URL}/evaluations/{evaluation_id}/audio/",
+            timeout=10,
+            stream=True
+        )
+        return StreamingHttpResponse(
+            _stream_body(response),
+            status=response.status_code,
+            content_type=response.headers.get('Content-Type', 'application/octet-stream')
         )
-        return JsonResponse(response.json(), status=response.status_code)
     except requests.RequestException as e:
         return JsonResponse({'error': f'Backend connection error: {str(e)}'}, status=503)
 
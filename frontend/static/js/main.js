@@ -212,12 +212,16 @@ document.addEventListener('DOMContentLoaded', function() {
         const metrics = result.metrics;
         
         let audioSection = '';
-        if (result.success && result.audio_base64) {
+        // Batch results link to their audio; inline base64 is only sent when requested.
+        // The backend's absolute URL names its own host, so play it through this site's /api proxy
+        const audioSrc = (result.audio_url && new URL(result.audio_url, window.location.origin).pathname)
+            || (result.audio_base64 && `data:audio/${metrics.audio_format || 'mp3'};base64,${result.audio_base64}`);
+        if (result.success && audioSrc) {
             audioSection = `
                 <div class="audio-player">
                     <div class="audio-player-label">Audio Playback</div>
-                    <audio controls data-evaluation-id="${result.evaluation_id || ''}"
-                           src="data:audio/${metrics.audio_format || 'mp3'};base64,${result.audio_base64}">
+                    <audio controls preload="none" data-evaluation-id="${result.evaluation_id || ''}"
+                           src="${audioSrc}">
                         Your browser does not support the audio element.
                     </audio>
                 </div>